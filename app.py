@@ -2,29 +2,52 @@ import sys
 import os
 import threading
 import subprocess
+import signal
 import queue
+import socket
+import selectors
 import re
 import time
 import json
-import requests
 from datetime import datetime
 import logging
 import tempfile
+import hashlib
+import functools
+import contextlib
+import zipfile
 from urllib.parse import urlparse, parse_qs
 import random
 import base64
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # --- Flask Server ---
-from flask import Flask, request, jsonify, g, make_response
+from flask import Flask, request, jsonify, make_response
 from flask_cors import CORS
-from werkzeug.serving import run_simple
-from werkzeug.middleware.dispatcher import DispatcherMiddleware
+from werkzeug.serving import make_server
+
+# Optional production WSGI server; falls back to werkzeug's threaded server when missing
+try:
+    from waitress import create_server as waitress_create_server
+except ImportError:
+    waitress_create_server = None
+
+# Optional C JSON codec for the larger API payloads; stdlib json is used when it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # --- Configure Logging ---
+# Level comes from UMD_LOG (e.g. DEBUG, INFO, WARNING); debug output is off by default
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+try:
+    logger.setLevel(os.environ.get('UMD_LOG', 'INFO').upper())
+except ValueError:
+    logger.setLevel(logging.INFO)
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 # Console handler
@@ -33,6 +56,7 @@ console_handler.setFormatter(formatter)
 logger.addHandler(console_handler)
 
 # --- Path Helper Function ---
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     if getattr(sys, 'frozen', False):
@@ -46,8 +70,47 @@ FLASK_PORT = 5000
 app = Flask(__name__)
 CORS(app)
 
+class GuiMessageQueue:
+    """Queue for Flask-to-GUI messages that also pokes a socket on every put.
+
+    There is one consumer (the GUI thread), so a deque's atomic append/popleft is all
+    the locking needed. The GUI watches `wakeup_reader` with a QSocketNotifier, so it
+    is woken as soon as a message arrives instead of polling the queue on a timer.
+    """
+    def __init__(self):
+        self._items = collections.deque()
+        self.wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+
+    def put(self, item):
+        self._items.append(item)
+        try:
+            self._wakeup_writer.send(b'\0')
+        except OSError:
+            pass # Socket buffer full: a wake-up is already pending
+
+    def get_batch(self, max_items):
+        """Pops up to max_items messages in FIFO order; returns an empty list when there are none."""
+        items = self._items
+        batch = []
+        while items and len(batch) < max_items:
+            batch.append(items.popleft())
+        return batch
+
+    def qsize(self):
+        return len(self._items)
+
+    def clear_wakeups(self):
+        """Discards pending wake-up bytes; call before draining the queue."""
+        try:
+            while self.wakeup_reader.recv(4096):
+                pass
+        except OSError:
+            pass # Nothing left to read
+
 # Message queue for inter-thread communication (Flask to GUI)
-gui_message_queue = queue.Queue()
+gui_message_queue = GuiMessageQueue()
 
 # Path to the yt-dlp executable
 if getattr(sys, 'frozen', False):
@@ -64,10 +127,76 @@ if sys.platform == 'win32':
 # Use DEVNULL for subprocess stdout/stderr
 DEVNULL = subprocess.DEVNULL
 SUBPROCESS_CREATION_FLAGS = subprocess.DETACHED_PROCESS if sys.platform == 'win32' else 0
+# On POSIX each download gets its own session, so its pid is also the process-group id and
+# ffmpeg children spawned by yt-dlp can be signalled together with it
+DOWNLOAD_NEW_SESSION = sys.platform != 'win32'
+
+def _signal_process_group(process, sig):
+    # Like Popen.send_signal: once the child has been reaped its pid (and pgid) may be reused
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass # The whole group has already exited
+
+def stop_download_process(process, timeout=5):
+    """Terminates a download's yt-dlp process (and on POSIX its process group), escalating to
+    a kill if it is still running after `timeout` seconds."""
+    if DOWNLOAD_NEW_SESSION:
+        _signal_process_group(process, signal.SIGTERM)
+    else:
+        process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        logger.warning("Process %s ignored terminate; killing it.", process.pid)
+        if DOWNLOAD_NEW_SESSION:
+            _signal_process_group(process, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
 
 YT_DLP_BIN = resource_path('yt-dlp.exe') if sys.platform == 'win32' else resource_path('yt-dlp')
 FFMPEG_BIN = resource_path(os.path.join('ffmpeg', 'bin', 'ffmpeg.exe')) if sys.platform == 'win32' else resource_path(os.path.join('ffmpeg', 'bin', 'ffmpeg'))
 EXTENSION_SOURCE_DIR_BUNDLE = resource_path('extension')
+# --- Precompiled regular expressions (hot paths: download output, format parsing, filenames) ---
+DOWNLOAD_PROGRESS_RE = re.compile(rb'(\d+\.\d+)%')  # Matched against raw pipe bytes
+YTDLP_ERROR_LINE_RE = re.compile(r'ERROR: (.+)')
+# One pass over a `-F` row: id, ext, resolution (which may be the two words "audio only") and the rest
+FORMAT_LINE_RE = re.compile(r'(?P<id>\S+)\s+(?P<ext>\S+)\s+(?P<res>audio only|\S+)\s*(?P<note>.*)', re.IGNORECASE)
+INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+WINDOWS_RESERVED_NAME_RE = re.compile(r'^(con|prn|aux|nul|com[1-9]|lpt[1-9])$', re.IGNORECASE)
+# URL fragments that mark a playlist/collection ('playlist' also covers 'playlist?list=' and '/playlist/')
+PLAYLIST_URL_RE = re.compile(r'playlist|list=|/sets/|/collection/|album', re.IGNORECASE)
+
+# Optional pre-zipped copy of the extension folder; extracting one archive is much cheaper
+# than copying many small files. Falls back to the folder when it isn't bundled.
+EXTENSION_SOURCE_ZIP_BUNDLE = resource_path('extension.zip')
+
+def _copy_if_changed(src, dst):
+    """copytree copy_function that leaves files with matching size and mtime untouched."""
+    try:
+        src_st, dst_st = os.stat(src), os.stat(dst)
+        if src_st.st_size == dst_st.st_size and int(src_st.st_mtime) == int(dst_st.st_mtime):
+            return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
+
+EXTENSION_COPY_WORKERS = 8
+
+def _copy_tree_parallel(src_dir, dst_dir, max_workers=EXTENSION_COPY_WORKERS):
+    """Copies src_dir over dst_dir, running the per-file copies on a small thread pool."""
+    jobs = []
+    for root, _dirs, files in os.walk(src_dir):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(dst_root, exist_ok=True)  # Directories are created serially before any copy starts
+        jobs.extend((os.path.join(root, name), os.path.join(dst_root, name)) for name in files)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_copy_if_changed, src, dst) for src, dst in jobs]
+        for future in as_completed(futures):
+            future.result()  # Re-raise the first copy error
 
 # --- Smart User Agent Manager ---
 class UserAgentManager:
@@ -143,36 +272,35 @@ class URLAnalyzer:
         }
     }
     
+    # Generic temporary URL patterns
+    GENERIC_TEMP_PATTERNS = [
+        r'blob:', r'\.m3u8(\?|$)', r'\.mpd(\?|$)', r'manifest\.',
+        r'videoplayback\?', r'/hls/', r'/dash/'
+    ]
+
+    # Patterns compiled once: one alternation per platform, and one for all temporary-URL patterns
+    _PLATFORM_RES = {
+        platform: re.compile('|'.join(config['patterns']))
+        for platform, config in PLATFORM_CONFIG.items()
+    }
+    _TEMPORARY_URL_RE = re.compile('|'.join(
+        GENERIC_TEMP_PATTERNS
+        + [pattern for config in PLATFORM_CONFIG.values() for pattern in config.get('temp_patterns', [])]
+    ))
+    
     @classmethod
     def detect_platform(cls, url):
         """Detect which platform a URL belongs to"""
         url_lower = url.lower()
-        for platform, config in cls.PLATFORM_CONFIG.items():
-            if any(re.search(pattern, url_lower) for pattern in config['patterns']):
+        for platform, platform_re in cls._PLATFORM_RES.items():
+            if platform_re.search(url_lower):
                 return platform
         return 'generic'
     
     @classmethod
     def is_temporary_url(cls, url):
-        """Enhanced temporary URL detection"""
-        url_lower = url.lower()
-        
-        # Generic temporary patterns
-        generic_patterns = [
-            r'blob:', r'\.m3u8(\?|$)', r'\.mpd(\?|$)', r'manifest\.',
-            r'videoplayback\?', r'/hls/', r'/dash/'
-        ]
-        
-        if any(re.search(pattern, url_lower) for pattern in generic_patterns):
-            return True
-        
-        # Platform-specific temporary patterns
-        for platform, config in cls.PLATFORM_CONFIG.items():
-            temp_patterns = config.get('temp_patterns', [])
-            if any(re.search(pattern, url_lower) for pattern in temp_patterns):
-                return True
-        
-        return False
+        """Enhanced temporary URL detection (generic and platform-specific patterns)"""
+        return cls._TEMPORARY_URL_RE.search(url.lower()) is not None
     
     @classmethod
     def needs_cookies(cls, url):
@@ -186,13 +314,15 @@ class URLAnalyzer:
     
     @classmethod
     def get_platform_config(cls, url):
-        """Get platform-specific configuration"""
+        """Get platform-specific configuration (a fresh copy, tagged with the platform name)"""
         platform = cls.detect_platform(url)
-        return cls.PLATFORM_CONFIG.get(platform, {
+        config = cls.PLATFORM_CONFIG.get(platform, {
             'needs_cookies': False,
             'required_headers': ['User-Agent'],
             'user_agent_type': 'chrome_windows'
         })
+        # Callers may run on several Flask threads at once; never hand out the shared class dict
+        return {**config, 'platform': platform}
 
 # --- Enhanced Cookie Manager ---
 class CookieManager:
@@ -206,18 +336,23 @@ class CookieManager:
         'tiktok': [r'sessionid', r'tt_csrf_token', r'tt_webid']
     }
     
+    _ESSENTIAL_COOKIE_RES = {
+        platform: re.compile('|'.join(pattern.lower() for pattern in patterns))
+        for platform, patterns in ESSENTIAL_COOKIE_PATTERNS.items()
+    }
+    
     @classmethod
     def filter_essential_cookies(cls, cookies, platform):
         """Filter cookies to only essential ones for the platform"""
         if not cookies or platform not in cls.ESSENTIAL_COOKIE_PATTERNS:
             return cookies
         
-        essential_patterns = cls.ESSENTIAL_COOKIE_PATTERNS[platform]
+        essential_re = cls._ESSENTIAL_COOKIE_RES[platform]
         filtered_cookies = []
         
         for cookie in cookies:
             cookie_name = cookie.get('name', '').lower()
-            if any(re.search(pattern.lower(), cookie_name) for pattern in essential_patterns):
+            if essential_re.search(cookie_name):
                 filtered_cookies.append(cookie)
         
         logger.info(f"Filtered {len(cookies)} cookies to {len(filtered_cookies)} essential ones for {platform}")
@@ -337,16 +472,37 @@ class SettingsManager:
 
 settings = SettingsManager()
 
-# Ensure binaries exist
-if not os.path.exists(YT_DLP_BIN):
+def _build_subprocess_env():
+    """Environment for bundled yt-dlp/ffmpeg runs: ffmpeg's folder on PATH, UTF-8 output."""
+    env_vars = os.environ.copy()
+    ffmpeg_dir = os.path.dirname(FFMPEG_BIN)
+    if ffmpeg_dir not in env_vars.get('PATH', '').split(os.pathsep):
+        env_vars['PATH'] = ffmpeg_dir + os.pathsep + env_vars.get('PATH', '')
+    return env_vars
+
+# Built once; the process environment doesn't change while the app runs
+SUBPROCESS_ENV = _build_subprocess_env()
+YT_DLP_ENV = {**SUBPROCESS_ENV, 'PYTHONIOENCODING': 'utf-8', 'LANG': 'en_US.UTF-8', 'LC_ALL': 'en_US.UTF-8'}
+# Opened once and handed to every short-lived yt-dlp run as stdin
+SUBPROCESS_STDIN = os.open(os.devnull, os.O_RDONLY)
+# Python's own descriptors are non-inheritable (PEP 446), so POSIX children can skip the fd-closing pass
+SUBPROCESS_CLOSE_FDS = sys.platform == 'win32'
+
+# Ensure binaries exist; checked once, the bundled paths don't change while running
+YT_DLP_AVAILABLE = os.path.exists(YT_DLP_BIN)
+FFMPEG_AVAILABLE = os.path.exists(FFMPEG_BIN)
+if not YT_DLP_AVAILABLE:
     logger.warning(f"yt-dlp binary not found at {YT_DLP_BIN}.")
-if not os.path.exists(FFMPEG_BIN):
+if not FFMPEG_AVAILABLE:
     logger.warning(f"ffmpeg binary not found at {FFMPEG_BIN}.")
 
+# Only the tail of yt-dlp's error output is logged or reported; it can run to megabytes
+ERROR_LOG_TAIL_CHARS = 8192
+ERROR_TAIL_LINES = 10
+
 def run_yt_dlp_command(args, cookies=None, timeout=None, platform_config=None, retry_count=0):
     """Enhanced yt-dlp command runner with smart retry logic"""
     temp_cookie_file_path = None
-    env = os.environ.copy()
     max_retries = settings.get('retry_attempts')
     
     try:
@@ -402,7 +558,7 @@ def run_yt_dlp_command(args, cookies=None, timeout=None, platform_config=None, r
                             os.chmod(temp_cookie_file_path, 0o600)
                         
                         base_args.extend(['--cookies', temp_cookie_file_path])
-                        logger.debug(f"Using {len(valid_cookies)} cookies from file: {temp_cookie_file_path}")
+                        logger.debug("Using %d cookies from file: %s", len(valid_cookies), temp_cookie_file_path)
                     except Exception as e:
                         logger.error(f"Error writing cookie file: {e}")
                         if temp_cookie_file_path and os.path.exists(temp_cookie_file_path):
@@ -412,23 +568,18 @@ def run_yt_dlp_command(args, cookies=None, timeout=None, platform_config=None, r
         # Combine arguments
         command = [YT_DLP_BIN] + base_args + args
         
-        logger.debug(f"Running yt-dlp (attempt {retry_count + 1}/{max_retries + 1}): {' '.join(command[:5])}...")
-        
-        # Enhanced environment
-        env.update({
-            'PYTHONIOENCODING': 'utf-8',
-            'LANG': 'en_US.UTF-8',
-            'LC_ALL': 'en_US.UTF-8'
-        })
+        logger.debug("Running yt-dlp (attempt %d/%d): %s...", retry_count + 1, max_retries + 1, ' '.join(command[:5]))
         
         result = subprocess.run(
             command, 
+            stdin=SUBPROCESS_STDIN,
             capture_output=True, 
             text=True, 
             check=False, 
             startupinfo=startupinfo, 
             timeout=timeout,
-            env=env
+            close_fds=SUBPROCESS_CLOSE_FDS,
+            env=YT_DLP_ENV
         )
         
         # Enhanced error handling with retry logic
@@ -458,7 +609,7 @@ def run_yt_dlp_command(args, cookies=None, timeout=None, platform_config=None, r
                 )
             
             logger.error(f"yt-dlp command failed after {retry_count + 1} attempts with exit code {result.returncode}")
-            logger.error(f"Stderr: {result.stderr}")
+            logger.error("Stderr (tail): %s", result.stderr[-ERROR_LOG_TAIL_CHARS:])
             return None, result.stderr
         
         return result.stdout, result.stderr
@@ -475,7 +626,7 @@ def run_yt_dlp_command(args, cookies=None, timeout=None, platform_config=None, r
         if temp_cookie_file_path and os.path.exists(temp_cookie_file_path):
             try:
                 os.unlink(temp_cookie_file_path)
-                logger.debug(f"Cleaned up cookie file: {temp_cookie_file_path}")
+                logger.debug("Cleaned up cookie file: %s", temp_cookie_file_path)
             except Exception as e:
                 logger.error(f"Error removing cookie file: {e}")
 
@@ -489,19 +640,43 @@ def after_request(response):
 
 def run_command_in_bundle(command_parts, **kwargs):
     """Runs a subprocess command, ensuring yt-dlp and ffmpeg paths are used."""
-    env_vars = os.environ.copy()
-    ffmpeg_dir = os.path.dirname(FFMPEG_BIN)
-    if ffmpeg_dir not in env_vars.get('PATH', '').split(os.pathsep):
-        env_vars['PATH'] = ffmpeg_dir + os.pathsep + env_vars.get('PATH', '')
     if command_parts and command_parts[0] == 'yt-dlp':
         command_parts[0] = YT_DLP_BIN
-    logger.debug(f"Running command: {' '.join(command_parts[:3])}...")
+    logger.debug("Running command: %s...", ' '.join(command_parts[:3]))
+    kwargs.setdefault('stdin', SUBPROCESS_STDIN)
+    kwargs.setdefault('close_fds', SUBPROCESS_CLOSE_FDS)
     try:
-        return subprocess.run(command_parts, env=env_vars, startupinfo=startupinfo, creationflags=SUBPROCESS_CREATION_FLAGS, **kwargs)
+        return subprocess.run(command_parts, env=SUBPROCESS_ENV, startupinfo=startupinfo, creationflags=SUBPROCESS_CREATION_FLAGS, **kwargs)
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
         logger.error(f"Command execution error: {e}")
         raise
 
+PREDICTED_FILENAME_CACHE_SIZE = 256
+_predicted_filename_cache = collections.OrderedDict()
+_predicted_filename_lock = threading.Lock()
+
+def predict_yt_dlp_filename(url, output_template, extra_args=(), cookie_args=()):
+    """Returns yt-dlp's first predicted name for url, caching successful lookups."""
+    key = (url, output_template, tuple(extra_args))
+    with _predicted_filename_lock:
+        cached = _predicted_filename_cache.get(key)
+        if cached is not None:
+            _predicted_filename_cache.move_to_end(key)
+            return cached
+
+    info_command = [YT_DLP_BIN, '--get-filename', '--no-warnings', *cookie_args, '-o', output_template, *extra_args, url]
+    info_result = run_command_in_bundle(info_command, capture_output=True, text=True, check=False, timeout=30)
+    stdout = info_result.stdout.strip()
+    predicted = stdout.split('\n', 1)[0] if stdout else ""
+
+    # Only cache real answers so a transient failure is retried next time
+    if predicted and predicted != 'NA':
+        with _predicted_filename_lock:
+            _predicted_filename_cache[key] = predicted
+            if len(_predicted_filename_cache) > PREDICTED_FILENAME_CACHE_SIZE:
+                _predicted_filename_cache.popitem(last=False)
+    return predicted
+
 def sanitize_filename(filename):
     """Sanitize filename for the current OS."""
     if not filename:
@@ -510,12 +685,10 @@ def sanitize_filename(filename):
     # Remove query parameters and fragments
     filename = filename.split('?')[0].split('#')[0]
     
-    invalid_chars_regex = r'[<>:"/\\|?*\x00-\x1F]'
-    sanitized = re.sub(invalid_chars_regex, '_', filename)
+    sanitized = INVALID_FILENAME_CHARS_RE.sub('_', filename)
     if sys.platform == 'win32':
-        reserved_names = re.compile(r'^(con|prn|aux|nul|com[1-9]|lpt[1-9])$', re.IGNORECASE)
         name_without_ext = os.path.splitext(sanitized)[0]
-        if reserved_names.match(name_without_ext):
+        if WINDOWS_RESERVED_NAME_RE.match(name_without_ext):
             sanitized = '_' + sanitized
         sanitized = sanitized.rstrip('. ')
     max_length = 200
@@ -524,32 +697,154 @@ def sanitize_filename(filename):
         sanitized = name[:max_length - len(ext)] + ext
     return sanitized or "download"
 
+# Read size for subprocess pipes; large reads keep the per-chunk syscall overhead low
+PIPE_READ_CHUNK_SIZE = 32768
+# Progress lines are forwarded to the GUI only after this much change or this many seconds
+PROGRESS_MIN_STEP_PCT = 0.5
+PROGRESS_MIN_INTERVAL = 0.25
+
+class _LineSplitter:
+    """Splits raw pipe chunks into lines. '\r' counts as a line break because yt-dlp redraws
+    its progress line with carriage returns."""
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk):
+        self._buffer += chunk.replace(b'\r', b'\n')
+        if b'\n' not in chunk and b'\r' not in chunk:
+            return []
+        *lines, rest = self._buffer.split(b'\n')
+        self._buffer = rest
+        return [bytes(line) for line in lines if line]
+
+    def flush(self):
+        rest, self._buffer = bytes(self._buffer), bytearray()
+        return [rest] if rest else []
+
+def _iter_process_lines(process, cancel_event, poll_interval=0.1):
+    """Yields (is_stderr, line) from a Popen's binary stdout/stderr pipes as lines arrive.
+
+    Lines are yielded as undecoded bytes; callers decode only the ones they actually use.
+
+    Both pipes are drained together, so output on one never blocks reading the other. Stops when
+    both pipes reach EOF or `cancel_event` is set (checked at least every `poll_interval` seconds).
+    """
+    if sys.platform == 'win32':
+        # select() only works on sockets on Windows; use one pump thread per pipe instead
+        yield from _iter_process_lines_threaded(process, cancel_event, poll_interval)
+        return
+
+    streams = {process.stdout.fileno(): False, process.stderr.fileno(): True}
+    splitters = {fd: _LineSplitter() for fd in streams}
+    with selectors.DefaultSelector() as selector:
+        for fd in streams:
+            selector.register(fd, selectors.EVENT_READ)
+        while streams and not cancel_event.is_set():
+            for key, _ in selector.select(timeout=poll_interval):
+                fd = key.fd
+                is_stderr = streams[fd]
+                chunk = os.read(fd, PIPE_READ_CHUNK_SIZE)
+                if not chunk: # EOF
+                    selector.unregister(fd)
+                    del streams[fd]
+                    lines = splitters[fd].flush()
+                else:
+                    lines = splitters[fd].feed(chunk)
+                for line in lines:
+                    yield is_stderr, line
+
+def _iter_process_lines_threaded(process, cancel_event, poll_interval):
+    """Thread-based fallback for _iter_process_lines (used where pipes can't be selected)."""
+    lines_queue = queue.Queue()
+
+    def pump(pipe, is_stderr):
+        splitter = _LineSplitter()
+        try:
+            while True:
+                chunk = os.read(pipe.fileno(), PIPE_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                for line in splitter.feed(chunk):
+                    lines_queue.put((is_stderr, line))
+            for line in splitter.flush():
+                lines_queue.put((is_stderr, line))
+        except OSError:
+            pass # Pipe closed underneath us (process killed)
+        finally:
+            lines_queue.put((is_stderr, None)) # EOF marker
+
+    for pipe, is_stderr in ((process.stdout, False), (process.stderr, True)):
+        threading.Thread(target=pump, args=(pipe, is_stderr), daemon=True).start()
+
+    open_pipes = 2
+    while open_pipes and not cancel_event.is_set():
+        try:
+            is_stderr, line = lines_queue.get(timeout=poll_interval)
+        except queue.Empty:
+            continue
+        if line is None:
+            open_pipes -= 1
+        else:
+            yield is_stderr, line
+
+def _normalize_dir_name(name):
+    """Folds a file name the way the platform's default filesystem compares names."""
+    return name.casefold() if sys.platform in ('win32', 'darwin') else name
+
+def _list_dir_names(directory):
+    """Returns the set of normalized entry names in directory (empty if it doesn't exist yet)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {_normalize_dir_name(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def _directory_size(path):
+    """Total size of the files under path, reusing scandir's cached stat data where the OS provides it."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _directory_size(entry.path)
+            elif entry.is_file():
+                total += entry.stat().st_size
+    return total
+
+# Anti-detection options appended to every download command
+DOWNLOAD_EXTRA_ARGS = ('--no-check-certificate', '--no-warnings', '--socket-timeout', '60', '--retries', '3')
+
+def _build_download_cmd(command_template, url, output_template, cookie_args, platform_config=None):
+    """Returns the full yt-dlp download command: binary, cookies, the route's template, platform headers, output."""
+    platform_args = []
+    if platform_config:
+        user_agent = UserAgentManager.get_random_user_agent(
+            platform_config.get('user_agent_type', 'chrome_windows')
+        )
+        platform_args += ['--user-agent', user_agent, '--add-header', 'Accept-Language:en-US,en;q=0.9']
+        
+        # Add platform-specific headers
+        required_headers = platform_config.get('required_headers', [])
+        if 'X-IG-App-ID' in required_headers:
+            platform_args += ['--add-header', 'X-IG-App-ID:936619743392459']
+        if 'Referer' in required_headers and 'tiktok' in url.lower():
+            platform_args += ['--add-header', 'Referer:https://www.tiktok.com/']
+    
+    return [*command_template[:1], *cookie_args, *command_template[1:], *platform_args,
+            '-o', output_template, *DOWNLOAD_EXTRA_ARGS]
+
 def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_merged_download, download_dir, cancel_event, cookie_string=None, platform_config=None):
     """Enhanced download with platform-specific handling"""
+    # Cancelled while still queued: the GUI has already shown 'Cancelled' and dropped the row,
+    # so skip the entry without posting anything that could touch a re-added download of this URL
+    if cancel_event.is_set():
+        return
     filename = "Playlist Download" if is_playlist else os.path.basename(url)
     current_process = None
     temp_cookie_file = None
+    # Messages for the end of this download, posted to the GUI together in the finally block
+    final_events = []
     
     try:
-        # Build enhanced command with platform-specific optimizations
-        enhanced_command = command_template.copy()
-        
-        # Add platform-specific arguments
-        if platform_config:
-            user_agent = UserAgentManager.get_random_user_agent(
-                platform_config.get('user_agent_type', 'chrome_windows')
-            )
-            enhanced_command.extend(['--user-agent', user_agent])
-            
-            # Add platform-specific headers
-            required_headers = platform_config.get('required_headers', [])
-            enhanced_command.extend(['--add-header', 'Accept-Language:en-US,en;q=0.9'])
-            
-            if 'X-IG-App-ID' in required_headers:
-                enhanced_command.extend(['--add-header', 'X-IG-App-ID:936619743392459'])
-            if 'Referer' in required_headers and 'tiktok' in url.lower():
-                enhanced_command.extend(['--add-header', 'Referer:https://www.tiktok.com/'])
-        
         # Handle cookies with enhanced processing
         cookie_args = []
         if cookie_string:
@@ -573,10 +868,7 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
 
         if is_playlist:
             # For playlists, get the playlist title to use as a directory name
-            info_command = [YT_DLP_BIN, '--get-filename', '--no-warnings', *cookie_args, '-o', '%(playlist_title)s', '--playlist-end', '1', url]
-            info_result = run_command_in_bundle(info_command, capture_output=True, text=True, check=False, timeout=30)
-            
-            raw_title = info_result.stdout.strip().split('\n')[0] if info_result.stdout.strip() else "Playlist"
+            raw_title = predict_yt_dlp_filename(url, '%(playlist_title)s', ('--playlist-end', '1'), cookie_args) or "Playlist"
             predicted_filename = sanitize_filename(raw_title)
             filename = predicted_filename  # This name is sent to the GUI
             
@@ -587,11 +879,8 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
             # Ensure the target directory for the playlist exists, as yt-dlp can fail on this
             os.makedirs(os.path.dirname(final_output_template), exist_ok=True)
         else:  # For single files
-            info_command = [YT_DLP_BIN, '--get-filename', '--no-warnings', *cookie_args, '-o', '%(title)s.%(ext)s', '--no-playlist', url]
-            info_result = run_command_in_bundle(info_command, capture_output=True, text=True, check=False, timeout=30)
-            
-            predicted_filename_raw = info_result.stdout.strip()
-            if predicted_filename_raw and predicted_filename_raw != 'NA':
+            predicted_filename_raw = predict_yt_dlp_filename(url, '%(title)s.%(ext)s', ('--no-playlist',), cookie_args)
+            if predicted_filename_raw:
                 predicted_filename = sanitize_filename(predicted_filename_raw)
             else:
                 # *** NEW: Smart fallback for direct media URLs without a title ***
@@ -617,81 +906,72 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
             if not ext:
                 ext = '.mp4' if media_type == 'video' else '.mp3'
             current_filename = base_name + ext
-            counter = 0
-            while not settings.get('overwrite_existing_file') and os.path.exists(os.path.join(download_dir, current_filename)):
-                counter += 1
-                current_filename = f"{base_name} ({counter}){ext}"
+            if not settings.get('overwrite_existing_file'):
+                # One directory listing instead of a stat() per candidate name
+                existing_names = _list_dir_names(download_dir)
+                counter = 0
+                while _normalize_dir_name(current_filename) in existing_names:
+                    counter += 1
+                    current_filename = f"{base_name} ({counter}){ext}"
             
             final_output_template = os.path.join(download_dir, current_filename)
             final_output_path = final_output_template  # The path to verify is the file itself
             filename = current_filename  # This name is sent to the GUI
 
-        enhanced_command.extend(['-o', final_output_template])
-        
-        # Add anti-detection measures
-        enhanced_command.extend([
-            '--no-check-certificate',
-            '--no-warnings',
-            '--socket-timeout', '60',
-            '--retries', '3'
-        ])
-        
         gui_message_queue.put({'type': 'update_download_status', 'url': url, 'filename': filename, 'status': 'Initializing'})
         
-        # Insert cookie args and run process
-        final_command = enhanced_command[:1] + cookie_args + enhanced_command[1:]
+        final_command = _build_download_cmd(command_template, url, final_output_template, cookie_args, platform_config)
         
+        # Unbuffered binary pipes: _iter_process_lines reads them in large chunks itself
         current_process = subprocess.Popen(
             final_command, 
             stdout=subprocess.PIPE, 
             stderr=subprocess.PIPE, 
-            text=True, 
-            bufsize=1, 
-            universal_newlines=True, 
+            bufsize=0, 
             creationflags=SUBPROCESS_CREATION_FLAGS, 
-            startupinfo=startupinfo
+            startupinfo=startupinfo,
+            start_new_session=DOWNLOAD_NEW_SESSION
         )
         
         gui_message_queue.put({'type': 'register_process', 'url': url, 'process': current_process, 'cancel_event': cancel_event})
         
         # Enhanced output processing
-        stdout_lines = []
-        error_lines = []
-        while True:
-            if cancel_event.is_set():
-                logger.info(f"Cancellation event set for {url}. Breaking download loop.")
-                break
-            
-            stdout_line = current_process.stdout.readline()
-            stderr_line = current_process.stderr.readline()
-            
-            if not stdout_line and not stderr_line and current_process.poll() is not None:
-                break
-            
-            if stdout_line:
-                stdout_lines.append(stdout_line)
-                if '[download]' in stdout_line and '%' in stdout_line:
-                    match = re.search(r'(\d+\.\d+)%', stdout_line)
-                    if match:
-                        progress = match.group(1) + '%'
-                        gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Downloading', 'progress': progress})
-                elif '[ExtractAudio]' in stdout_line or '[ffmpeg]' in stdout_line:
-                    gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Processing'})
-            
-            if stderr_line:
-                error_lines.append(stderr_line)
-                logger.debug(f"yt-dlp stderr: {stderr_line.strip()}")
-
-        return_code = current_process.poll()
+        error_lines = collections.deque(maxlen=ERROR_TAIL_LINES)
+        last_progress_pct = -1.0
+        last_progress_push = 0.0
+        for is_stderr, line in _iter_process_lines(current_process, cancel_event):
+            if is_stderr:
+                error_lines.append(line)  # Kept as bytes; only decoded if the download fails
+                logger.debug("yt-dlp stderr: %r", line)
+            elif b'[download]' in line and b'%' in line:
+                match = DOWNLOAD_PROGRESS_RE.search(line)
+                if match:
+                    # yt-dlp redraws progress several times a second; forward only visible changes
+                    progress_pct = float(match.group(1))
+                    now = time.monotonic()
+                    if (progress_pct - last_progress_pct < PROGRESS_MIN_STEP_PCT
+                            and now - last_progress_push < PROGRESS_MIN_INTERVAL
+                            and progress_pct < 100.0):
+                        continue
+                    last_progress_pct = progress_pct
+                    last_progress_push = now
+                    progress = match.group(1).decode('ascii') + '%'
+                    gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Downloading', 'progress': progress})
+            elif b'[ExtractAudio]' in line or b'[ffmpeg]' in line:
+                gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Processing'})
         
         # Handle cancellation FIRST
         if cancel_event.is_set():
+            logger.info(f"Cancellation event set for {url}. Stopped reading download output.")
             gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Cancelled', 'message': 'Download cancelled by user.'})
             return  # Exit immediately after cancellation
             
+        # Both pipes hit EOF, so the process is exiting; reap it for the return code
+        return_code = current_process.wait()
+
         # Then handle process return codes
         if return_code not in [0, -15]:  # -15 is SIGTERM on Unix
-            error_msg = '\n'.join(error_lines[-10:])
+            error_msg = b'\n'.join(error_lines).decode('utf-8', 'replace')
             raise Exception(f"yt-dlp download failed (exit code {return_code}): {error_msg}")
         
         # --- FIX #3: Overhauled file verification logic ---
@@ -703,21 +983,23 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
             if os.path.isdir(final_output_path):
                 try:
                     # Calculate total size of all files in the playlist directory
-                    actual_filesize_bytes = sum(os.path.getsize(os.path.join(dirpath, f)) for dirpath, _, filenames in os.walk(final_output_path) for f in filenames)
+                    actual_filesize_bytes = _directory_size(final_output_path)
                 except Exception as e:
                     logger.warning(f"Could not calculate total size of playlist directory {final_output_path}: {e}")
                     actual_filesize_bytes = 0  # Report 0 if error
             else:
                 raise Exception(f"Downloaded playlist directory not found at expected location: {final_output_path}")
         else:  # single file
-            if os.path.exists(final_output_path):
-                actual_filesize_bytes = os.path.getsize(final_output_path)
-            else:
-                raise Exception(f"Downloaded file not found at expected location: {final_output_path}")
+            # One stat() answers both "does it exist" and "how big is it"
+            try:
+                actual_filesize_bytes = os.stat(final_output_path).st_size
+            except FileNotFoundError:
+                raise Exception(f"Downloaded file not found at expected location: {final_output_path}") from None
 
         detected_filetype = 'playlist' if is_playlist else media_type
 
-        gui_message_queue.put({
+        # Final status and the completed entry go over as one batch message
+        final_events.append({
             'type': 'update_download_status', 
             'url': url, 
             'status': 'Completed', 
@@ -725,7 +1007,7 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
             'filename': actual_filename, 
             'filesize_bytes': actual_filesize_bytes
         })
-        gui_message_queue.put({
+        final_events.append({
             'type': 'add_completed', 
             'url': url, 
             'filetype': detected_filetype, 
@@ -738,19 +1020,20 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
     
     except Exception as e:
         error_message = str(e)
-        gui_message_queue.put({'type': 'update_download_status', 'url': url, 'status': 'Failed', 'message': error_message, 'filename': filename})
-        logger.error(f"Error during download for {url}: {error_message}")
+        final_events.append({'type': 'update_download_status', 'url': url, 'status': 'Failed', 'message': error_message, 'filename': filename})
+        logger.error("Error during download for %s: %s", url, error_message)
+        logger.debug("Download failure traceback for %s", url, exc_info=True)
     
     finally:
-        # ONLY terminate if process is still running AND we're canceling
-        if current_process and current_process.poll() is None and cancel_event.is_set():
+        # A process still running here was cancelled or abandoned by an error: stop it, escalating to kill
+        if current_process and current_process.poll() is None:
             try:
-                current_process.terminate()
-                current_process.wait(timeout=5)
+                stop_download_process(current_process)
             except Exception as e:
                 logger.error(f"Error terminating process: {e}")
                 
-        gui_message_queue.put({'type': 'remove_process', 'url': url})
+        final_events.append({'type': 'remove_process', 'url': url})
+        gui_message_queue.put({'type': 'batch', 'events': final_events})
         
         if temp_cookie_file and os.path.exists(temp_cookie_file):
             try:
@@ -758,19 +1041,58 @@ def _perform_yt_dlp_download(command_template, url, is_playlist, media_type, is_
             except Exception as e:
                 logger.error(f"Error removing temp cookie file: {e}")
 
+class DownloadWorkerPool:
+    """Fixed set of daemon threads that run queued downloads, capping concurrent yt-dlp processes.
+
+    Workers are started on the first submit so importing the module doesn't spawn threads.
+    """
+    def __init__(self, num_workers):
+        self._tasks = queue.Queue()
+        self._num_workers = num_workers
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        self._ensure_started()
+        self._tasks.put((fn, args))
+
+    def _ensure_started(self):
+        if self._started:
+            return
+        with self._start_lock:
+            if self._started:
+                return
+            for i in range(self._num_workers):
+                threading.Thread(target=self._worker, name=f"download-worker-{i}", daemon=True).start()
+            self._started = True
+
+    def _worker(self):
+        while True:
+            fn, args = self._tasks.get()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Download worker task failed")
+            finally:
+                self._tasks.task_done()
+
+# Downloads beyond this many wait in the queue with status 'Queued'
+MAX_CONCURRENT_DOWNLOADS = min(8, (os.cpu_count() or 2) * 2)
+download_pool = DownloadWorkerPool(MAX_CONCURRENT_DOWNLOADS)
+
 @app.route("/health", methods=["GET"])
 def health_check():
     return jsonify({"status": "healthy", "version": "2.1"})
 
-@app.route('/shutdown', methods=['POST'])
-def shutdown():
-    # FIX #2: Gracefully handle missing shutdown function
-    func = request.environ.get('werkzeug.server.shutdown')
-    if func is None:
-        logger.warning("Shutdown command received, but not running with the Werkzeug Server. Cannot self-terminate.")
-        return jsonify({'status': 'error', 'message': 'Not running with the Werkzeug Server'}), 500
-    func()
-    return jsonify({'status': 'success', 'message': 'Server is shutting down.'})
+def analyze_request_url(url):
+    """URLAnalyzer results for url, bundled in the shape the routes and start_download use."""
+    platform_config = URLAnalyzer.get_platform_config(url)
+    return {
+        'platform': platform_config['platform'],
+        'platform_config': platform_config,
+        'needs_cookies': URLAnalyzer.needs_cookies(url),
+        'is_temporary': URLAnalyzer.is_temporary_url(url),
+    }
 
 @app.route("/analyze_url", methods=["POST"])
 def analyze_url():
@@ -780,13 +1102,14 @@ def analyze_url():
     if not url:
         return jsonify({"error": "URL is required"}), 400
     
-    platform = URLAnalyzer.detect_platform(url)
-    platform_config = URLAnalyzer.get_platform_config(url)
+    url_info = analyze_request_url(url)
+    platform = url_info['platform']
+    platform_config = url_info['platform_config']
     
     analysis = {
         "platform": platform,
-        "is_temporary": URLAnalyzer.is_temporary_url(url),
-        "needs_cookies": URLAnalyzer.needs_cookies(url),
+        "is_temporary": url_info['is_temporary'],
+        "needs_cookies": url_info['needs_cookies'],
         "required_headers": platform_config.get('required_headers', []),
         "user_agent_type": platform_config.get('user_agent_type', 'chrome_windows'),
         "suggestions": []
@@ -801,6 +1124,47 @@ def analyze_url():
     
     return jsonify(analysis)
 
+def json_response(payload):
+    """jsonify() replacement for the format endpoints: encodes with orjson when it's installed."""
+    if orjson is None:
+        return jsonify(payload)
+    return app.response_class(orjson.dumps(payload), mimetype='application/json')
+
+def json_loads(text):
+    """Parses yt-dlp's JSON output; orjson's errors subclass json.JSONDecodeError."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+FORMATS_CACHE_TTL = 300  # seconds; signed media URLs in the listing expire, so keep this short
+FORMATS_CACHE_SIZE = 64
+_formats_cache = collections.OrderedDict()
+_formats_cache_lock = threading.Lock()
+
+def _get_cached_formats(key):
+    with _formats_cache_lock:
+        entry = _formats_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if time.monotonic() - stored_at > FORMATS_CACHE_TTL:
+            del _formats_cache[key]
+            return None
+        _formats_cache.move_to_end(key)
+        return payload
+
+def _cookies_digest(cookies):
+    """Short fingerprint of a cookie set, so format lists fetched with different cookies get separate cache entries."""
+    if not cookies:
+        return None
+    values = sorted((c.get('domain', ''), c.get('name', ''), c.get('value', '')) for c in cookies)
+    return hashlib.blake2b(repr(values).encode('utf-8'), digest_size=16).hexdigest()
+
+def _store_cached_formats(key, payload):
+    with _formats_cache_lock:
+        _formats_cache[key] = (time.monotonic(), payload)
+        _formats_cache.move_to_end(key)
+        while len(_formats_cache) > FORMATS_CACHE_SIZE:
+            _formats_cache.popitem(last=False)
+
 @app.route("/get_formats", methods=["POST"])
 def get_formats():
     """Enhanced format retrieval with smart fallbacks"""
@@ -810,17 +1174,25 @@ def get_formats():
     if not url:
         return jsonify({"error": "URL is required"}), 400
     
-    platform = URLAnalyzer.detect_platform(url)
-    platform_config = URLAnalyzer.get_platform_config(url)
-    platform_config['platform'] = platform  # Add platform info for cookie filtering
+    url_info = analyze_request_url(url)
+    platform = url_info['platform']
+    platform_config = url_info['platform_config']  # Carries the platform name for cookie filtering
     
     # Filter cookies if we have them
-    if cookies and URLAnalyzer.needs_cookies(url):
+    if cookies and url_info['needs_cookies']:
         cookies = CookieManager.validate_cookies(cookies)
         if platform != 'generic':
             cookies = CookieManager.filter_essential_cookies(cookies, platform)
         logger.info(f"Using {len(cookies)} filtered cookies for {platform}")
     
+    # The extension asks again every time its popup opens; answer repeats without re-running yt-dlp
+    # Keyed on the cookie values actually passed to yt-dlp: after a login or cookie refresh the
+    # list may include formats the old cookies couldn't see
+    cache_key = (url, _cookies_digest(cookies) if url_info['needs_cookies'] else None)
+    cached_payload = _get_cached_formats(cache_key)
+    if cached_payload is not None:
+        return json_response(cached_payload)
+    
     # FIX #1 & #4: Removed unsupported/redundant flags from approaches
     format_approaches = [
         # Standard approach
@@ -834,7 +1206,7 @@ def get_formats():
         
         stdout, stderr = run_yt_dlp_command(
             args, 
-            cookies if URLAnalyzer.needs_cookies(url) else None, 
+            cookies if url_info['needs_cookies'] else None, 
             timeout=60,  # Increased timeout
             platform_config=platform_config
         )
@@ -842,27 +1214,29 @@ def get_formats():
         if stdout:
             # FIX #1: Adjusted index check after removing an approach
             if approach_idx == 0:  # Standard format list approach
-                formats = stdout.strip().split('\n')
-                parsed_formats = parse_format_list(formats)
+                parsed_formats = parse_format_list(stdout.splitlines())
                 if parsed_formats:
-                    return jsonify({
+                    payload = {
                         "formats": parsed_formats, 
                         "used_cookies": bool(cookies),
                         "platform": platform,
                         "approach": f"method_{approach_idx + 1}"
-                    })
+                    }
+                    _store_cached_formats(cache_key, payload)
+                    return json_response(payload)
             else:  # JSON dump approach
                 try:
-                    import json
-                    video_info = json.loads(stdout)
+                    video_info = json_loads(stdout)
                     formats = extract_formats_from_json(video_info)
                     if formats:
-                        return jsonify({
+                        payload = {
                             "formats": formats, 
                             "used_cookies": bool(cookies),
                             "platform": platform,
                             "approach": "json_fallback"
-                        })
+                        }
+                        _store_cached_formats(cache_key, payload)
+                        return json_response(payload)
                 except json.JSONDecodeError:
                     logger.warning("Failed to parse JSON output")
     
@@ -882,7 +1256,7 @@ def get_formats():
             error_msg = "Request timed out. The server may be overloaded."
         else:
             # Extract the actual error message
-            error_match = re.search(r'ERROR: (.+)', stderr)
+            error_match = YTDLP_ERROR_LINE_RE.search(stderr)
             if error_match:
                 error_msg = f"{platform.title()} error: {error_match.group(1)}"
     
@@ -893,85 +1267,94 @@ def get_formats():
         "suggestions": get_error_suggestions(platform, stderr)
     }), 500
 
-def parse_format_list(formats):
-    """Enhanced format parsing with better error handling"""
-    parsed_formats = []
-    header_found = False
-    
-    for line in formats:
+# Prefixes of yt-dlp log lines that can be interleaved with the format table
+_INFO_LINE_PREFIXES = ('[', 'WARNING', 'ERROR')
+
+def _find_format_table_start(lines):
+    """Returns the index of the first line after the `-F` table header, or None if there is no header."""
+    for idx, line in enumerate(lines):
+        line = line.lstrip()
+        if line.startswith(_INFO_LINE_PREFIXES):
+            continue
+        # yt-dlp prints "ID  EXT  RESOLUTION ..."; older youtube-dl used lowercase column names
+        header = line.upper()
+        if 'ID' in header and ('EXT' in header or 'RESOLUTION' in header):
+            return idx + 1
+    return None
+
+def _iter_format_rows(lines):
+    """Yields a format dict for each parseable row of the `-F` table body."""
+    for line in lines:
         line = line.strip()
         if not line:
             continue
             
         # Skip info lines
-        if line.startswith('[') or line.startswith('WARNING') or line.startswith('ERROR'):
-            continue
-            
-        # Find header
-        if 'ID' in line and ('ext' in line or 'resolution' in line):
-            header_found = True
-            continue
-            
-        if not header_found:
+        if line.startswith(_INFO_LINE_PREFIXES):
             continue
         
         # Parse format line
         try:
-            # Split by whitespace but be careful with the note field
-            parts = line.split()
-            if len(parts) >= 3:
-                format_info = {
-                    "id": parts[0],
-                    "ext": parts[1],
-                    "resolution": parts[2] if len(parts) > 2 else "unknown"
-                }
+            match = FORMAT_LINE_RE.match(line)
+            if match:
+                format_id, ext, resolution, note = match.group('id', 'ext', 'res', 'note')
                 
-                # Handle the note field (everything after resolution)
-                if len(parts) > 3:
-                    note_parts = parts[3:]
-                    # Clean up common yt-dlp format descriptions
-                    note = ' '.join(note_parts)
-                    note = re.sub(r'\s+', ' ', note).strip()  # Normalize whitespace
-                    format_info["note"] = note[:100] + "..." if len(note) > 100 else note
-                else:
-                    format_info["note"] = ""
+                # Clean up common yt-dlp format descriptions (everything after resolution)
+                note = ' '.join(note.split())  # Normalize whitespace
+                if len(note) > 100:
+                    note = note[:100] + "..."
                 
                 # Enhanced type detection
-                resolution = format_info["resolution"].lower()
-                note = format_info.get("note", "").lower()
+                resolution_lower = resolution.lower()
+                note_lower = note.lower()
                 
-                if 'audio only' in resolution or 'audio only' in note:
-                    format_info["type"] = "audio"
-                elif any(vid_indicator in note for vid_indicator in ['video', 'mp4', 'webm', 'mkv']):
-                    format_info["type"] = "video"
-                elif resolution != "unknown" and resolution not in ['audio', 'none']:
-                    format_info["type"] = "video"
+                if 'audio only' in resolution_lower or 'audio only' in note_lower:
+                    format_type = "audio"
+                elif any(vid_indicator in note_lower for vid_indicator in ['video', 'mp4', 'webm', 'mkv']):
+                    format_type = "video"
+                elif resolution_lower != "unknown" and resolution_lower not in ['audio', 'none']:
+                    format_type = "video"
                 else:
-                    format_info["type"] = "audio" if format_info["ext"] in ['m4a', 'mp3', 'aac', 'opus'] else "video"
+                    format_type = "audio" if ext in ['m4a', 'mp3', 'aac', 'opus'] else "video"
                 
                 # Add quality indicators
-                if 'best' in note:
-                    format_info["quality"] = "best"
-                elif 'worst' in note:
-                    format_info["quality"] = "worst"
+                if 'best' in note_lower:
+                    quality = "best"
+                elif 'worst' in note_lower:
+                    quality = "worst"
                 else:
-                    format_info["quality"] = "standard"
+                    quality = "standard"
                 
-                parsed_formats.append(format_info)
+                # Built once with its final shape rather than grown key by key
+                yield {
+                    "id": format_id,
+                    "ext": ext,
+                    "resolution": resolution,
+                    "note": note,
+                    "type": format_type,
+                    "quality": quality,
+                }
                 
         except Exception as e:
-            logger.debug(f"Skipping unparseable format line: {line} - {e}")
+            logger.debug("Skipping unparseable format line: %s - %s", line, e)
             continue
-    
-    # Sort formats by quality (best first)
-    parsed_formats.sort(key=lambda f: (
+
+def _format_sort_key(f):
+    return (
         f["type"] == "video",  # Video formats first
         f["quality"] == "best",  # Best quality first
         f["resolution"] != "audio only",  # Non-audio formats first
         f["id"]
-    ), reverse=True)
+    )
+
+def parse_format_list(formats):
+    """Enhanced format parsing with better error handling"""
+    table_start = _find_format_table_start(formats)
+    if table_start is None:
+        return []
     
-    return parsed_formats
+    # Sort formats by quality (best first); rows stream straight from the parser into the sort
+    return sorted(_iter_format_rows(formats[table_start:]), key=_format_sort_key, reverse=True)
 
 def extract_formats_from_json(video_info):
     """Extract formats from JSON dump as fallback"""
@@ -1049,23 +1432,31 @@ def get_error_suggestions(platform, stderr):
 @app.route("/download", methods=["POST"])
 def download():
     """Enhanced download with platform-specific optimizations"""
-    data = request.json
+    body, status_code = start_download(request.json)
+    return jsonify(body), status_code
+
+def start_download(data):
+    """Queues a download described by a /download payload; returns (response body, status code).
+
+    Called by the /download route for the browser extension and directly by the GUI, which
+    runs in the same process and has no need for the HTTP round-trip.
+    """
     url = data.get("url")
     format_id = data.get("format_id")
     media_type = data.get("media_type", "video")
     cookies = data.get("cookies")
     
     if not url:
-        return jsonify({"error": "URL is required"}), 400
+        return {"error": "URL is required"}, 400
     
     # Get platform configuration
-    platform = URLAnalyzer.detect_platform(url)
-    platform_config = URLAnalyzer.get_platform_config(url)
-    platform_config['platform'] = platform
+    url_info = analyze_request_url(url)
+    platform = url_info['platform']
+    platform_config = url_info['platform_config']
     
     # Process cookies with platform-specific filtering
     cookie_string = None
-    if URLAnalyzer.needs_cookies(url) and cookies:
+    if url_info['needs_cookies'] and cookies:
         validated_cookies = CookieManager.validate_cookies(cookies)
         if platform != 'generic':
             validated_cookies = CookieManager.filter_essential_cookies(validated_cookies, platform)
@@ -1112,10 +1503,7 @@ def download():
     command_template.append(url)
     
     # Detect playlist
-    is_playlist = any(pattern in url.lower() for pattern in [
-        'playlist?list=', '/playlist/', '/sets/', '/collection/',
-        'album', 'playlist', 'list='
-    ])
+    is_playlist = PLAYLIST_URL_RE.search(url) is not None
     
     download_dir = settings.get('download_save_directory')
     cancel_event = threading.Event()
@@ -1130,23 +1518,22 @@ def download():
         'cancel_event': cancel_event
     })
     
-    # Start enhanced download in background thread
-    threading.Thread(
-        target=_perform_yt_dlp_download,
-        args=(command_template, url, is_playlist, media_type, False, download_dir, cancel_event, cookie_string, platform_config),
-        daemon=True
-    ).start()
+    # Hand the download to the worker pool; it starts as soon as a worker is free
+    download_pool.submit(
+        _perform_yt_dlp_download,
+        command_template, url, is_playlist, media_type, False, download_dir, cancel_event, cookie_string, platform_config
+    )
     
-    return jsonify({
+    return {
         "message": f"Download started successfully for {platform} content!",
         "platform": platform,
         "url_analysis": {
             "platform": platform,
-            "is_temporary": URLAnalyzer.is_temporary_url(url),
-            "needs_cookies": URLAnalyzer.needs_cookies(url),
+            "is_temporary": url_info['is_temporary'],
+            "needs_cookies": url_info['needs_cookies'],
             "used_enhanced_cookies": bool(cookie_string)
         }
-    })
+    }, 200
 
 @app.route('/set_browser_monitor_status', methods=['POST'])
 def set_browser_monitor_status():
@@ -1157,37 +1544,60 @@ def set_browser_monitor_status():
         return jsonify({'status': 'success', 'message': f'Browser monitoring set to {status}'})
     return jsonify({'status': 'error', 'message': 'Invalid status provided'}), 400
 
+# Set by start_flask_server once the listening socket is bound
+flask_server_ready = threading.Event()
+# The running WSGI server and the thread serving it, kept so stop_flask_server can end it directly
+flask_server = None
+flask_server_thread = None
+
 def start_flask_server():
     """Starts the Flask server."""
+    global flask_server, flask_server_thread
     try:
-        app_wrapper = DispatcherMiddleware(app)
-        run_simple('127.0.0.1', FLASK_PORT, app_wrapper, use_reloader=False, use_debugger=False, threaded=True)
+        # Both servers bind in their constructor, so readiness can be signalled before serving
+        if waitress_create_server is not None:
+            logger.info(f"Serving Flask app with waitress on 127.0.0.1:{FLASK_PORT}")
+            flask_server = waitress_create_server(app, host='127.0.0.1', port=FLASK_PORT, threads=8)
+            serve = flask_server.run
+        else:
+            flask_server = make_server('127.0.0.1', FLASK_PORT, app, threaded=True)
+            serve = flask_server.serve_forever
+        flask_server_thread = threading.current_thread()
+        flask_server_ready.set()
+        serve()
     except Exception as e:
         logger.critical(f"Failed to start Flask server: {e}")
         gui_message_queue.put({'type': 'exit'})
 
-def wait_for_flask_server(max_retries=20, delay=0.2):
-    """Wait for Flask server to be ready by polling the health endpoint."""
-    for i in range(max_retries):
-        try:
-            response = requests.get(f"http://localhost:{FLASK_PORT}/health", timeout=0.5)
-            if response.status_code == 200 and response.json().get('status') == 'healthy':
-                logger.info(f"Flask server is ready after {i+1} retries.")
-                return True
-        except requests.exceptions.RequestException:
-            logger.debug(f"Attempt {i+1}/{max_retries}: Flask server not yet reachable.")
-        time.sleep(delay)
-    logger.error(f"Flask server did not become ready after {max_retries} retries.")
+def stop_flask_server(timeout=2):
+    """Stops the server started by start_flask_server and waits up to `timeout` seconds for its thread."""
+    server = flask_server
+    if server is None:
+        return True # Never started
+    if waitress_create_server is not None:
+        server.close() # Removes the listener from waitress's socket map, which ends server.run()
+    else:
+        server.shutdown() # Returns once serve_forever() has stopped
+        server.server_close()
+    if flask_server_thread is not None:
+        flask_server_thread.join(timeout)
+        return not flask_server_thread.is_alive()
+    return True
+
+def wait_for_flask_server(timeout=5):
+    """Wait for the Flask server thread to bind its socket."""
+    if flask_server_ready.wait(timeout):
+        return True
+    logger.error(f"Flask server did not become ready within {timeout}s.")
     return False
 
+BYTE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB')
+
 def format_bytes(bytes_val):
     if bytes_val == 0: return "0 B"
-    units = ['B', 'KiB', 'MiB', 'GiB', 'TiB']
-    i = 0
-    while bytes_val >= 1024 and i < len(units) - 1:
-        bytes_val /= 1024
-        i += 1
-    return f"{bytes_val:.2f} {units[i]}"
+    # Each unit step is a factor of 2**10, so the bit length gives the unit directly
+    i = min((int(bytes_val).bit_length() - 1) // 10, len(BYTE_UNITS) - 1) if bytes_val >= 1 else 0
+    return f"{bytes_val / (1 << (10 * i)):.2f} {BYTE_UNITS[i]}"
 
 # --- Merged GUI Code ---
 
@@ -1199,7 +1609,6 @@ import threading
 import subprocess
 import shutil
 import queue
-import requests
 import time
 from datetime import datetime
 import logging
@@ -1214,13 +1623,39 @@ from PySide6.QtWidgets import (
     QTableView, QHeaderView, QAbstractItemView, QSplitter, QCheckBox
 )
 from PySide6.QtCore import (
-    Qt, QTimer, QUrl, Signal, QModelIndex, QRect, QSize, QPoint,  QEasingCurve, Property, QPropertyAnimation
+    Qt, QTimer, QUrl, Signal, QModelIndex, QRect, QRectF, QSize, QPoint,  QEasingCurve, Property, QPropertyAnimation,
+    QRunnable, QThreadPool, QSocketNotifier, Slot
 )
-from PySide6.QtGui import QColor, QFont, QDesktopServices, QIcon, QPixmap, QPalette, QPaintEvent, QPainter
+from PySide6.QtGui import QColor, QFont, QDesktopServices, QIcon, QPixmap, QPixmapCache, QPalette, QPaintEvent, QPainter
 
 # Setup logger for the GUI
 logger = logging.getLogger(__name__)
 
+
+class TrackedProcess:
+    """A download's yt-dlp process (None until it has started) and its cancel event."""
+    __slots__ = ('process', 'cancel_event')
+
+    def __init__(self, process, cancel_event):
+        self.process = process
+        self.cancel_event = cancel_event
+
+
+class FunctionRunnable(QRunnable):
+    """Runs a plain function call on a QThreadPool worker thread."""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.exception(f"Unhandled error in background task {getattr(self.fn, '__name__', self.fn)}: {e}")
+
+
 # --- Custom Widgets ---
 # Custom Button for Sidebar with Hover Effect
 class SidebarButton(QPushButton):
@@ -1277,15 +1712,7 @@ class SidebarButton(QPushButton):
         if not self.icon_label:
             return
         
-        # Replace fill color in SVG data
-        colored_svg = svg_data.replace('currentColor', color)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(colored_svg.encode('utf-8'))
-        
-        # Scale pixmap to desired icon size
-        scaled_pixmap = pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.icon_label.setPixmap(scaled_pixmap)
+        self.icon_label.setPixmap(render_svg_pixmap(svg_data, color, 20, 20))
 
     def setChecked(self, checked):
         super().setChecked(checked)
@@ -1318,6 +1745,31 @@ ICONS = {
     "arrow-down": """<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="3" stroke-linecap="round" stroke-linejoin="round" class="lucide lucide-arrow-down"><path d="M12 5v14"/><path d="m19 12-7 7-7-7"/></svg>"""
 }
 
+# Each icon pre-encoded once and split around its colour placeholder, keyed by the SVG text
+ICON_SVG_PARTS = {svg: tuple(svg.encode('utf-8').split(b'currentColor')) for svg in ICONS.values()}
+# Stable QPixmapCache key prefix per icon (its name in ICONS)
+ICON_CACHE_NAMES = {svg: name for name, svg in ICONS.items()}
+
+def render_svg_pixmap(svg_data, color, width, height):
+    """Returns svg_data recoloured and rasterised at width x height.
+
+    Rendered pixmaps live in Qt's application-wide QPixmapCache: icons are re-applied on
+    every check/sort change, and QPixmap is implicitly shared, so all widgets showing the
+    same icon reuse one pixmap. Must be called from the GUI thread.
+    """
+    name = ICON_CACHE_NAMES.get(svg_data) or f"h{hash(svg_data):x}"
+    key = f"svg:{name}:{color}:{width}x{height}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    parts = ICON_SVG_PARTS.get(svg_data)
+    if parts is None:
+        parts = svg_data.encode('utf-8').split(b'currentColor')
+    pixmap.loadFromData(color.encode('utf-8').join(parts))
+    pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
 # Custom QLineEdit with an integrated search icon
 class SearchLineEdit(QLineEdit):
     # Added main_window_instance parameter
@@ -1366,21 +1818,24 @@ class SearchLineEdit(QLineEdit):
             }
         """)
         
-        # Connect text changed signal for live filtering
-        self.textChanged.connect(self.main_window_instance.filter_displayed_items)
+        # Live filtering, debounced so a burst of keystrokes filters the table once
+        self.filter_debounce_timer = QTimer(self)
+        self.filter_debounce_timer.setSingleShot(True)
+        self.filter_debounce_timer.setInterval(150)
+        self.filter_debounce_timer.timeout.connect(self._apply_filter)
+        self.textChanged.connect(self.filter_debounce_timer.start)
         # Connect the icon button's clicked signal to trigger search explicitly
-        self.search_icon_button.clicked.connect(lambda: self.main_window_instance.filter_displayed_items(self.text()))
+        self.search_icon_button.clicked.connect(self._apply_filter)
+
+    @Slot()
+    def _apply_filter(self):
+        self.filter_debounce_timer.stop()
+        self.main_window_instance.filter_displayed_items(self.text())
 
     def set_search_icon(self, color="#adb5bd"):
         """Sets the search icon for the QPushButton."""
-        search_icon_svg = ICONS["search"]
-        colored_svg = search_icon_svg.replace('currentColor', color)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(colored_svg.encode('utf-8'))
-        
-        # Scale pixmap to desired icon size (slightly smaller than button for padding)
-        scaled_pixmap = pixmap.scaled(16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Slightly smaller than the button for padding
+        scaled_pixmap = render_svg_pixmap(ICONS["search"], color, 16, 16)
         self.search_icon_button.setIcon(QIcon(scaled_pixmap))
         self.search_icon_button.setIconSize(scaled_pixmap.size())
 
@@ -1488,8 +1943,15 @@ class QCustomCheckBox(QCheckBox):
 
     def adjustWidgetSize(self):
         # Calculate dimensions based on height for a consistent look
-        track_width = self.height() * 2.0 # Slightly adjusted for better proportion
-        thumb_size = self.height() - 6 # Padding for the thumb inside the track
+        height = self.height()
+        track_width = height * 2.0 # Slightly adjusted for better proportion
+        thumb_size = height - 6 # Padding for the thumb inside the track
+        
+        # Cached for paintEvent/setup_animation, which run on every animation frame
+        self._track_rect = QRectF(0, 0, track_width, height)
+        self._track_radius = height / 2
+        self._thumb_size = thumb_size
+        self._thumb_y = (height - thumb_size) / 2
         
         # Position the label next to the track
         label_margin_left = 10 # Space between track and label
@@ -1518,6 +1980,7 @@ class QCustomCheckBox(QCheckBox):
         # Calculate start and end values for the thumb's position
         # Thumb moves from left (margin) to right (track_width - thumb_size - margin)
         margin = 3 # Margin from the edge of the track
+        # Use the live height: setChecked() can run before the first resize updates the cached geometry
         track_width = self.height() * 2.0
         thumb_size = self.height() - 6
 
@@ -1539,34 +2002,13 @@ class QCustomCheckBox(QCheckBox):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.NoPen)
         
-        # Fill background with transparent color
-        painter.setBrush(QColor(0, 0, 0, 0))  # Fully transparent
-        painter.drawRect(self.rect())
+        # Checked state: active color for track; unchecked: background color
+        painter.setBrush(self._activeColor if self.isChecked() else self.bgColor)
+        painter.drawRoundedRect(self._track_rect, self._track_radius, self._track_radius)
         
-        # Draw the track
-        track_width = self.height() * 2.0
-        track_height = self.height()
-        track_radius = track_height / 2
-        
-        # Draw the thumb (circle)
-        thumb_size = self.height() - 6  # 3px padding on each side
-        thumb_y = (track_height - thumb_size) / 2
-
-        # FIX #8: Cast float position to int for drawing
-        thumb_x = int(self.pos)
-
-        if self.isChecked():
-            # Checked state: active color for track, circle on the right
-            painter.setBrush(self._activeColor)
-            painter.drawRoundedRect(0, 0, track_width, track_height, track_radius, track_radius)
-            painter.setBrush(self._circleColor)
-            painter.drawEllipse(thumb_x, thumb_y, thumb_size, thumb_size)
-        else:
-            # Unchecked state: background color for track, circle on the left
-            painter.setBrush(self.bgColor)
-            painter.drawRoundedRect(0, 0, track_width, track_height, track_radius, track_radius)
-            painter.setBrush(self._circleColor)
-            painter.drawEllipse(thumb_x, thumb_y, thumb_size, thumb_size)
+        # Draw the thumb (circle); FIX #8: cast float position to int for drawing
+        painter.setBrush(self._circleColor)
+        painter.drawEllipse(QRectF(int(self.pos), self._thumb_y, self._thumb_size, self._thumb_size))
 
         painter.end()
 
@@ -1584,12 +2026,20 @@ class CustomHeaderView(QHeaderView):
         self.sort_indicator_label.setAlignment(Qt.AlignCenter) # Center the icon in the label
         self.sort_indicator_label.setStyleSheet("background-color: transparent;") # Ensure no background interferes
         
+        # Both arrows rendered once in the header text colour; sort changes only swap pixmaps
+        self._arrow_pixmaps = {
+            Qt.AscendingOrder: render_svg_pixmap(ICONS["arrow-up"], "#d1d1d1", 10, 10),
+            Qt.DescendingOrder: render_svg_pixmap(ICONS["arrow-down"], "#d1d1d1", 10, 10),
+        }
+        self._shown_sort_order = None # Order whose arrow the label currently holds
+        self._shown_indicator_state = None # (x, y, order) of the visible arrow; None while hidden
+        
         # Connect to the section clicked signal to update the sort indicator
         self.sectionClicked.connect(self._update_sort_indicator_position)
         self.sectionResized.connect(self._update_sort_indicator_position)
         self.sectionMoved.connect(self._update_sort_indicator_position)
         
-        print("DEBUG: CustomHeaderView initialized.")
+        logger.debug("CustomHeaderView initialized.")
 
     def _update_sort_indicator_position(self):
         sort_column = self.sortIndicatorSection() 
@@ -1613,34 +2063,27 @@ class CustomHeaderView(QHeaderView):
             # Let's say we want 5px padding from the top of the header.
             label_y = section_rect.top() + 2 # 5px from the top of the section
             
+            # Resizing a column fires for every section; most don't move the arrow at all
+            if (label_x, label_y, sort_order) == self._shown_indicator_state:
+                return
+            self._shown_indicator_state = (label_x, label_y, sort_order)
+            
             self.sort_indicator_label.move(label_x, label_y)
             
-            # Set the appropriate arrow icon
-            if sort_order == Qt.AscendingOrder:
-                self._set_arrow_icon(ICONS["arrow-up"])
-            elif sort_order == Qt.DescendingOrder:
-                self._set_arrow_icon(ICONS["arrow-down"])
+            # Set the appropriate arrow icon (only when the order actually flipped)
+            if sort_order != self._shown_sort_order and sort_order in self._arrow_pixmaps:
+                self.sort_indicator_label.setPixmap(self._arrow_pixmaps[sort_order])
+                self._shown_sort_order = sort_order
             
             self.sort_indicator_label.show()
             
             # Request a repaint of the header to ensure the label is drawn correctly
             self.viewport().update() 
-        else:
+        elif self._shown_indicator_state is not None:
+            self._shown_indicator_state = None
             self.sort_indicator_label.hide() # Hide if no column is sorted
             self.viewport().update() # Request repaint to clear hidden label
 
-    def _set_arrow_icon(self, svg_data, color="#d1d1d1"): # Use header text color
-        """Sets an SVG icon for the sort indicator label, coloring it."""
-        # Replace fill color in SVG data
-        colored_svg = svg_data.replace('currentColor', color)
-        
-        pixmap = QPixmap()
-        pixmap.loadFromData(colored_svg.encode('utf-8'))
-        
-        # Scale pixmap to desired icon size
-        scaled_pixmap = pixmap.scaled(self.sort_indicator_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.sort_indicator_label.setPixmap(scaled_pixmap)
-
     # --- FIX: REMOVED THESE OVERRIDES ---
     # def sortIndicatorSection(self):
     #     if self.model() and self.model().isSortingEnabled():
@@ -1662,22 +2105,102 @@ class CustomHeaderView(QHeaderView):
 from PySide6.QtCore import QAbstractTableModel
 
 
+def _format_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M') if timestamp else "N/A"
+
+def _format_location(path):
+    return os.path.dirname(path) if path != 'N/A' else 'N/A'
+
+def _cached_display_text(item, field, default, cache_key, render):
+    """Returns render(item[field]), memoised on the item until the field's value changes.
+
+    Qt asks for every visible cell on each repaint; this keeps strftime/format_bytes/dirname
+    out of that path. The source value is stored alongside the text, so any code that
+    mutates the item invalidates the cached string automatically.
+    """
+    value = item.get(field, default)
+    cached = item.get(cache_key)
+    if cached is not None and cached[0] == value:
+        return cached[1]
+    text = render(value)
+    item[cache_key] = (value, text)
+    return text
+
+def _search_text(item):
+    """Lower-cased text the search box matches against, memoised on the item like the cell text."""
+    source = (item.get('filename', ''), item.get('url', ''), item.get('status', ''), item.get('filetype', ''))
+    cached = item.get('_search_str')
+    if cached is not None and cached[0] == source:
+        return cached[1]
+    text = ''.join(source).lower()
+    item['_search_str'] = (source, text)
+    return text
+
+def _sort_key_progress(item):
+    try:
+        return float(item.get('progress', '0%').strip('%'))
+    except ValueError:
+        return 0
+
+def _sort_key_none(item):
+    return None
+
 class DownloadTableModel(QAbstractTableModel):
+    # Which header column displays each item field (used to limit dataChanged to real changes)
+    FIELD_TO_HEADER = {
+        'filename': "Name",
+        'url': "Name",
+        'timestamp': "Date",
+        'filesize_bytes': "Size",
+        'progress': "Progress",
+        'status': "Status",
+        'filetype': "Type",
+        'path': "Location",
+    }
+    # Sort key per column header; list.sort() evaluates each key once per item
+    SORT_KEYS = {
+        "Name": lambda item: item.get('filename', item.get('url', '')).lower(),
+        "Date": lambda item: item.get('timestamp', 0),
+        "Size": lambda item: item.get('filesize_bytes', 0),
+        "Progress": _sort_key_progress,
+        "Status": lambda item: item.get('status', '').lower(),
+        "Type": lambda item: item.get('filetype', '').lower(),
+        "Location": lambda item: os.path.dirname(item.get('path', '')).lower(),
+    }
+    # Fields a running download updates on every progress tick
+    PROGRESS_FIELDS = frozenset(('progress', 'status'))
+    PROGRESS_REPAINT_INTERVAL = 0.1 # seconds between progress repaints of one row
+
     def __init__(self, data, is_completed_model=False, parent=None):
         super().__init__(parent)
         self._data = data
+        self._row_by_url = {} # url -> row in self._data; rebuilt whenever rows move
+        self._index_rows(0)
+        # Progress-only repaints are limited per URL; skipped ones are flushed by a trailing timer
+        self._last_progress_emit = {}
+        self._deferred_progress_urls = set()
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(int(self.PROGRESS_REPAINT_INTERVAL * 1000))
+        self._progress_flush_timer.timeout.connect(self._flush_deferred_progress)
         self.is_completed_model = is_completed_model
         # Define headers based on whether it's an active or completed model
         if self.is_completed_model:
             self.header_labels = ["Name", "Date", "Size", "Type", "Location"]
         else:
             self.header_labels = ["Name", "Date", "Size", "Progress", "Status"]
+        self._column_count = len(self.header_labels) # Column set is fixed per model
+        self.field_to_column = {
+            field: self.header_labels.index(header)
+            for field, header in self.FIELD_TO_HEADER.items()
+            if header in self.header_labels
+        }
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._data)
 
     def columnCount(self, parent=QModelIndex()):
-        return len(self.header_labels)
+        return self._column_count
 
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
@@ -1690,13 +2213,9 @@ class DownloadTableModel(QAbstractTableModel):
                 if self.header_labels[column] == "Name":
                     return item.get('filename', item.get('url', 'N/A'))
                 elif self.header_labels[column] == "Date":
-                    timestamp = item.get('timestamp')
-                    if timestamp:
-                        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
-                    return "N/A"
+                    return _cached_display_text(item, 'timestamp', None, '_date_str', _format_timestamp)
                 elif self.header_labels[column] == "Size":
-                    filesize_bytes = item.get('filesize_bytes', 0)
-                    return format_bytes(filesize_bytes)
+                    return _cached_display_text(item, 'filesize_bytes', 0, '_size_str', format_bytes)
                 elif self.header_labels[column] == "Progress": # For active downloads
                     return item.get('progress', '0%')
                 elif self.header_labels[column] == "Type": # For completed downloads
@@ -1705,8 +2224,7 @@ class DownloadTableModel(QAbstractTableModel):
                 elif self.header_labels[column] == "Status":
                     return item.get('status', 'N/A')
                 elif self.header_labels[column] == "Location":
-                    path = item.get('path', 'N/A')
-                    return os.path.dirname(path) if path != 'N/A' else 'N/A'
+                    return _cached_display_text(item, 'path', 'N/A', '_dir_str', _format_location)
             except IndexError:
                 # This can happen briefly during filtering; it's safe to ignore.
                 return None
@@ -1720,78 +2238,219 @@ class DownloadTableModel(QAbstractTableModel):
     def sort(self, column, order):
         self.layoutAboutToBeChanged.emit()
         
-        column_name = self.header_labels[column]
-        
-        # Define a key function for sorting
-        def get_sort_key(item):
-            if column_name == "Name":
-                return item.get('filename', item.get('url', '')).lower()
-            elif column_name == "Date":
-                return item.get('timestamp', 0)
-            elif column_name == "Size":
-                return item.get('filesize_bytes', 0)
-            elif column_name == "Progress":
-                progress_str = item.get('progress', '0%').strip('%')
-                try:
-                    return float(progress_str)
-                except ValueError:
-                    return 0
-            elif column_name == "Status":
-                return item.get('status', '').lower()
-            elif column_name == "Type":
-                return item.get('filetype', '').lower()
-            elif column_name == "Location":
-                path = item.get('path', '')
-                return os.path.dirname(path).lower()
-            return None
-
+        # Pick the column's key function once instead of re-testing the column name per item
+        get_sort_key = self.SORT_KEYS.get(self.header_labels[column], _sort_key_none)
         self._data.sort(key=get_sort_key, reverse=(order == Qt.DescendingOrder))
+        self._reindex()
         
         self.layoutChanged.emit()
 
+    def _reindex(self):
+        """Rebuilds the url -> row index; if a URL appears twice its first row wins."""
+        self._row_by_url = {}
+        self._index_rows(0)
+
+    def _index_rows(self, start):
+        """Adds rows from `start` on to the url -> row index."""
+        row_by_url = self._row_by_url
+        for row in range(start, len(self._data)):
+            row_by_url.setdefault(self._data[row].get('url'), row)
+
     def addItem(self, item_data):
         """Adds a new item to the model."""
-        self.beginInsertRows(QModelIndex(), len(self._data), len(self._data))
+        row = len(self._data)
+        self.beginInsertRows(QModelIndex(), row, row)
         self._data.append(item_data)
+        self._index_rows(row)
         self.endInsertRows()
 
+    def _is_progress_tick(self, new_data):
+        return new_data.keys() <= self.PROGRESS_FIELDS and new_data.get('status', 'Downloading') == 'Downloading'
+
     def updateItem(self, url, new_data):
         """Updates data for a specific row identified by URL and emits dataChanged signal."""
-        # Iterate through the _data (which is the currently displayed/filtered data)
-        for row, item in enumerate(self._data):
-            if item.get('url') == url:
-                # Update only the changed fields
-                for key, value in new_data.items():
-                    item[key] = value
-                # Emit dataChanged for the entire row to ensure all columns update
-                self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
-                return True # Item found and updated
-        return False # Item not found in the currently displayed data
+        # Look up the row in the currently displayed/filtered data
+        row = self._row_by_url.get(url)
+        if row is None:
+            return False # Item not found in the currently displayed data
+        item = self._data[row]
+        # Update only the changed fields
+        for key, value in new_data.items():
+            item[key] = value
+        if self._is_progress_tick(new_data):
+            now = time.monotonic()
+            if now - self._last_progress_emit.get(url, 0.0) < self.PROGRESS_REPAINT_INTERVAL:
+                # Data is stored; the trailing flush repaints the row once the interval passes
+                self._deferred_progress_urls.add(url)
+                if not self._progress_flush_timer.isActive():
+                    self._progress_flush_timer.start()
+                return True
+            self._last_progress_emit[url] = now
+        else:
+            # Final states (Completed/Failed/...) always repaint immediately
+            self._last_progress_emit.pop(url, None)
+        fields = new_data.keys()
+        if url in self._deferred_progress_urls:
+            # A skipped tick for this row is still unpainted; repaint its fields along with this update
+            self._deferred_progress_urls.discard(url)
+            fields = fields | self.PROGRESS_FIELDS
+        self._emit_row_changed(row, fields)
+        return True # Item found and updated
+
+    def _emit_row_changed(self, row, fields):
+        """Repaints only the columns of `row` that display the given fields."""
+        columns = sorted({self.field_to_column[key] for key in fields if key in self.field_to_column})
+        # One emit per contiguous run, so unchanged columns between two changed ones aren't re-queried
+        while columns:
+            first = last = columns.pop(0)
+            while columns and columns[0] == last + 1:
+                last = columns.pop(0)
+            top_left = self.index(row, first)
+            bottom_right = top_left if first == last else self.index(row, last)
+            self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole])
+
+    def _flush_deferred_progress(self):
+        """Repaints rows whose progress ticks were skipped by updateItem's throttle."""
+        now = time.monotonic()
+        for url in self._deferred_progress_urls:
+            row = self._row_by_url.get(url)
+            if row is not None:
+                self._last_progress_emit[url] = now
+                self._emit_row_changed(row, self.PROGRESS_FIELDS)
+        self._deferred_progress_urls.clear()
+
+    def addItems(self, items):
+        """Appends several items with a single insert notification."""
+        if not items:
+            return
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._data.extend(items)
+        self._index_rows(first)
+        self.endInsertRows()
+
+    def removeItems(self, urls):
+        """Removes all rows whose URL is in `urls`, one notification per contiguous run of rows."""
+        self._remove_rows([row for row, item in enumerate(self._data) if item.get('url') in urls], urls)
+
+    def removeEntries(self, items):
+        """Removes exactly the given item dicts (not other rows that share their URLs)."""
+        ids = {id(item) for item in items}
+        self._remove_rows([row for row, item in enumerate(self._data) if id(item) in ids],
+                          {item.get('url') for item in items})
+
+    def _remove_rows(self, rows, urls):
+        """Removes the given ascending rows, one notification per contiguous run."""
+        if not rows:
+            return
+        # Walk the runs bottom-up so earlier row numbers stay valid
+        while rows:
+            last = rows.pop()
+            first = last
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._data[first:last + 1]
+            self.endRemoveRows()
+        self._reindex() # Remaining rows shifted up
+        for url in urls:
+            self._last_progress_emit.pop(url, None)
 
     def removeItem(self, url):
-        for row, item in enumerate(self._data):
-            if item.get('url') == url:
-                self.beginRemoveRows(QModelIndex(), row, row)
-                del self._data[row]
-                self.endRemoveRows()
-                return True
-        return False
+        row = self._row_by_url.get(url)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._data[row]
+        self._reindex() # Rows below shifted up by one
+        self.endRemoveRows()
+        self._last_progress_emit.pop(url, None)
+        return True
 
     def clearAll(self):
         self.beginResetModel()
         self._data.clear()
+        self._row_by_url = {}
+        self._last_progress_emit.clear()
+        self._deferred_progress_urls.clear()
         self.endResetModel()
 
-    def setFilteredData(self, filtered_data):
-        """Properly sets filtered data and notifies views."""
+    def setFilteredData(self, filtered_data, sort_column=-1, sort_order=Qt.AscendingOrder):
+        """Properly sets filtered data and notifies views.
+
+        With a sort column the list is sorted before the reset, so views get one reset
+        instead of a reset followed by a separate layout change from sort().
+        """
+        if sort_column != -1:
+            get_sort_key = self.SORT_KEYS.get(self.header_labels[sort_column], _sort_key_none)
+            filtered_data.sort(key=get_sort_key, reverse=(sort_order == Qt.DescendingOrder))
         self.beginResetModel()
         self._data = filtered_data
+        self._reindex()
         self.endResetModel()
 
     def getData(self):
         """Returns a copy of the current data."""
         return self._data[:] # Return a copy to prevent external modification
 
+# Shared look of the app's dialogs (AddDownloadDialog, ConfirmationDialog); the line-edit and
+# radio-button rules simply don't match anything in a confirmation dialog
+DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #2d2d2d;
+        border-radius: 10px;
+        border: 1px solid #495057;
+    }
+    QLabel {
+        color: #e0e0e0;
+        font-size: 13px;
+    }
+    QLineEdit {
+        background-color: #3a3a3a;
+        border: 1px solid #495057;
+        border-radius: 5px;
+        padding: 5px;
+        color: #e0e0e0;
+    }
+    QLineEdit:focus {
+        border: 1px solid #4dabf7;
+    }
+    QRadioButton::indicator {
+        width: 16px;
+        height: 16px;
+        border-radius: 8px;
+        border: 2px solid #495057;
+        background-color: #2d2d2d;
+    }
+    QRadioButton::indicator:checked {
+        background-color: #4dabf7;
+        border: 2px solid #4dabf7;
+    }
+    QRadioButton {
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #4dabf7;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 15px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #3b8fcc;
+    }
+    QPushButton#cancelButton {
+        background-color: #6c757d;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #5a6268;
+    }
+    QPushButton:focus {
+        outline: none;
+    }
+"""
+
 # Dialog for adding a new download
 class AddDownloadDialog(QDialog):
     def __init__(self, parent=None):
@@ -1805,61 +2464,7 @@ class AddDownloadDialog(QDialog):
         self.apply_dialog_style()
 
     def apply_dialog_style(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                border-radius: 10px;
-                border: 1px solid #495057;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 13px;
-            }
-            QLineEdit {
-                background-color: #3a3a3a;
-                border: 1px solid #495057;
-                border-radius: 5px;
-                padding: 5px;
-                color: #e0e0e0;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4dabf7;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                border: 2px solid #495057;
-                background-color: #2d2d2d;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #4dabf7;
-                border: 2px solid #4dabf7;
-            }
-            QRadioButton {
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #4dabf7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #3b8fcc;
-            }
-            QPushButton#cancelButton {
-                background-color: #6c757d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton:focus {
-                outline: none;
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLESHEET)
 
     def init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -1918,10 +2523,18 @@ class AddDownloadDialog(QDialog):
         
         main_layout.addLayout(button_layout)
 
+    def reset(self):
+        """Clears the previous entry so the dialog can be reused for the next download."""
+        self.url_entry.clear()
+        self.radio_video.setChecked(True)
+        for widget in (self.url_entry, self.radio_video, self.radio_audio, self.ok_button, self.cancel_button):
+            widget.setEnabled(True)
+        self.url_entry.setFocus()
+
 
 # Custom Confirmation Dialog (replaces QMessageBox)
 class ConfirmationDialog(QDialog):
-    def __init__(self, message, parent=None):
+    def __init__(self, message="", parent=None):
         super().__init__(parent)
         self.setWindowTitle("Confirm Action")
         self.setFixedSize(350, 150)
@@ -1932,10 +2545,10 @@ class ConfirmationDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
-        message_label = QLabel(message)
-        message_label.setAlignment(Qt.AlignCenter)
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
+        self.message_label = QLabel(message)
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch(1)
@@ -1955,41 +2568,17 @@ class ConfirmationDialog(QDialog):
         self.apply_dialog_style()
 
     def apply_dialog_style(self):
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                border-radius: 10px;
-                border: 1px solid #495057;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 13px;
-            }
-            QPushButton {
-                background-color: #4dabf7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #3b8fcc;
-            }
-            QPushButton#cancelButton {
-                background-color: #6c757d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton:focus {
-                outline: none;
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLESHEET)
+
+    def set_message(self, message):
+        self.message_label.setText(message)
 
 
 # Main Application Window
 class MainWindow(QMainWindow):
+    # Queue backlog at which a drain suspends repaints and repaints once at the end
+    BULK_REPAINT_THRESHOLD = 20
+
     # Signals for updating GUI from Flask thread
     add_download_signal = Signal(dict)
     update_download_status_signal = Signal(str, dict) # url, new_data_dict
@@ -2002,29 +2591,39 @@ class MainWindow(QMainWindow):
     def __init__(self):
         # ... (your existing __init__ method content) ...
         super().__init__()
-        logger.debug(f"MainWindow initialized. Initial browser_monitor_enabled: {settings.get('browser_monitor_enabled')}")
+        logger.debug("MainWindow initialized. Initial browser_monitor_enabled: %s", settings.get('browser_monitor_enabled'))
         self.setWindowTitle("Universal Media Tool")
         self.setGeometry(100, 100, 1000, 700)
         self.setMinimumSize(800, 600)
 
-        # Initialize data models
+        # Initialize data models. The *_data lists are the master lists; each model holds its
+        # own (filtered/sorted) display list so sorting never reorders the master lists.
         self.active_downloads_data = [] # Raw data list for filtering
-        self.active_downloads_model = DownloadTableModel(self.active_downloads_data, is_completed_model=False)
+        self.active_downloads_model = DownloadTableModel([], is_completed_model=False)
+        self._active_index = {} # url -> row in active_downloads_data, for O(1) lookups
 
         self.completed_videos_data = []
-        self.completed_videos_model = DownloadTableModel(self.completed_videos_data, is_completed_model=True)
+        self.completed_videos_model = DownloadTableModel([], is_completed_model=True)
         
         self.completed_audios_data = []
-        self.completed_audios_model = DownloadTableModel(self.completed_audios_data, is_completed_model=True)
+        self.completed_audios_model = DownloadTableModel([], is_completed_model=True)
         
         self.completed_playlists_data = []
-        self.completed_playlists_model = DownloadTableModel(self.completed_playlists_data, is_completed_model=True)
+        self.completed_playlists_model = DownloadTableModel([], is_completed_model=True)
 
         # Dictionary to store active download processes and their cancellation events
-        # Key: URL, Value: {'process': subprocess.Popen object, 'cancel_event': threading.Event}
+        # Key: URL, Value: TrackedProcess(process, cancel_event)
         self.active_processes = {}
+
+        # Bounded, reusable worker threads for short background jobs (HTTP calls, extraction)
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(8)
         
         self.current_panel_type = "active_downloads" # Initialize panel type early
+        self._shown_panel = None # Panel whose show_panel setup last ran
+
+        # Default extension extraction folder; resolved once instead of on every panel show
+        self._default_extension_target = os.path.join(os.path.expanduser("~"), "Downloads", "universal_media_tool_extension")
         
         # NOTE: init_ui is called here, so all methods it calls must be defined BEFORE init_ui
         self.init_ui() 
@@ -2033,15 +2632,27 @@ class MainWindow(QMainWindow):
 
         self.status_lock = threading.Lock() # For thread-safe status bar updates
 
-        # Timer for clearing status bar message
+        # Timer for clearing status bar message; it fires at or before _status_deadline and
+        # re-arms itself for the remainder, so new messages rarely have to restart it
         self.status_clear_timer = QTimer(self)
         self.status_clear_timer.setSingleShot(True)
-        self.status_clear_timer.timeout.connect(self._clear_status_bar)
-
-        # Start a QTimer to periodically check the Flask message queue
-        self.queue_timer = QTimer(self)
-        self.queue_timer.timeout.connect(self.check_flask_message_queue)
-        self.queue_timer.start(100) # Check every 100 ms
+        self.status_clear_timer.timeout.connect(self._on_status_clear_timeout)
+        self._status_deadline = 0.0 # time.monotonic() at which the current message expires
+
+        # Rate limiting / de-duplication state for show_status
+        self._last_status = None # (message, msg_type) of the last accepted status
+        self._last_status_time = 0.0
+        self._pending_status = None # (message, msg_type, timeout_ms) waiting for the debounce timer
+        self._status_style_type = 'info' # Style currently applied to status_label
+        self.status_debounce_timer = QTimer(self)
+        self.status_debounce_timer.setSingleShot(True)
+        self.status_debounce_timer.setInterval(250)
+        self.status_debounce_timer.timeout.connect(self._apply_pending_status)
+
+        # Drain the Flask message queue whenever it signals new messages (no polling)
+        self.queue_notifier = QSocketNotifier(gui_message_queue.wakeup_reader.fileno(), QSocketNotifier.Read, self)
+        self.queue_notifier.activated.connect(self.check_flask_message_queue)
+        QTimer.singleShot(0, self.check_flask_message_queue) # Pick up anything queued before the window existed
 
         # Show default panel and check its button AFTER all UI elements are initialized
         self.show_panel(self.active_downloads_panel)
@@ -2049,60 +2660,19 @@ class MainWindow(QMainWindow):
 
 
     # --- Panel Creation Functions (DEFINED WITHIN MainWindow) ---
-    def create_active_downloads_panel(self):
-        """Creates the panel for displaying active downloads."""
-        panel = QWidget()
-        panel.setObjectName("ActiveDownloadsPanel")
-        panel.setLayout(QVBoxLayout())
-        panel.layout().setContentsMargins(20, 20, 20, 20)
-        panel.layout().setSpacing(0)
-        
-        self.active_downloads_table_view = QTableView()
-        self.active_downloads_table_view.setModel(self.active_downloads_model)
-        self.active_downloads_table_view.setSortingEnabled(True)
-        
-        # --- Use CustomHeaderView directly for the horizontal header ---
-        custom_header = CustomHeaderView(Qt.Horizontal, self.active_downloads_table_view)
-        self.active_downloads_table_view.setHorizontalHeader(custom_header)
-        
-        custom_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        custom_header.setStretchLastSection(True)
-        
-        self.active_downloads_table_view.verticalHeader().setVisible(False)
-        self.active_downloads_table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.active_downloads_table_view.setAlternatingRowColors(True)
-        self.active_downloads_table_view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.active_downloads_table_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.active_downloads_table_view.setFocusPolicy(Qt.NoFocus)
-
-        # No setItemDelegate needed. CustomHeaderView handles sort indicator with QLabel.
-        # custom_header.setSectionsClickable(True) is handled in CustomHeaderView __init__
-        
-        self.active_downloads_table_view.setColumnWidth(0, 300) # Name
-        self.active_downloads_table_view.setColumnWidth(1, 150) # Date
-        self.active_downloads_table_view.setColumnWidth(2, 100) # Size
-        self.active_downloads_table_view.setColumnWidth(3, 100) # Progress
-        
-        panel.layout().addWidget(self.active_downloads_table_view)
-        
-        return panel
+    # Initial widths of the Name, Date, Size and Progress/Type columns
+    TABLE_COLUMN_WIDTHS = (300, 150, 100, 100)
 
-    def create_completed_panel(self, title, file_type):
-        """Creates a generic panel for displaying completed downloads (videos, audios, playlists)."""
+    def _create_table_panel(self, object_name, model):
+        """Builds a panel holding one download table; returns (panel, table_view)."""
         panel = QWidget()
-        panel.setObjectName(f"Completed{title}Panel")
+        panel.setObjectName(object_name)
         panel.setLayout(QVBoxLayout())
         panel.layout().setContentsMargins(20, 20, 20, 20)
         panel.layout().setSpacing(0)
         
         table_view = QTableView()
-        if file_type == "video":
-            table_view.setModel(self.completed_videos_model)
-        elif file_type == "audio":
-            table_view.setModel(self.completed_audios_model)
-        elif file_type == "playlist":
-            table_view.setModel(self.completed_playlists_model)
-            
+        table_view.setModel(model)
         table_view.setSortingEnabled(True)
         
         # --- Use CustomHeaderView directly for the horizontal header ---
@@ -2113,6 +2683,8 @@ class MainWindow(QMainWindow):
         custom_header.setStretchLastSection(True)
         
         table_view.verticalHeader().setVisible(False)
+        # Uniform row heights: the view never asks the model for per-row size hints
+        table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table_view.setAlternatingRowColors(True)
         table_view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
@@ -2122,21 +2694,30 @@ class MainWindow(QMainWindow):
         # No setItemDelegate needed. CustomHeaderView handles sort indicator with QLabel.
         # custom_header.setSectionsClickable(True) is handled in CustomHeaderView __init__
         
-        table_view.setColumnWidth(0, 300) # Name
-        table_view.setColumnWidth(1, 150) # Date
-        table_view.setColumnWidth(2, 100) # Size
-        table_view.setColumnWidth(3, 100) # Type
+        for column, width in enumerate(self.TABLE_COLUMN_WIDTHS):
+            table_view.setColumnWidth(column, width)
 
         panel.layout().addWidget(table_view)
+        return panel, table_view
+
+    def create_active_downloads_panel(self):
+        """Creates the panel for displaying active downloads."""
+        panel, self.active_downloads_table_view = self._create_table_panel("ActiveDownloadsPanel", self.active_downloads_model)
+        return panel
+
+    def create_completed_panel(self, title, file_type):
+        """Creates a generic panel for displaying completed downloads (videos, audios, playlists)."""
+        panel_type, data, model = {
+            "video": ("completed_videos", self.completed_videos_data, self.completed_videos_model),
+            "audio": ("completed_audios", self.completed_audios_data, self.completed_audios_model),
+            "playlist": ("completed_playlists", self.completed_playlists_data, self.completed_playlists_model),
+        }[file_type]
+        panel, table_view = self._create_table_panel(f"Completed{title}Panel", model)
+        table_view.doubleClicked.connect(self.handle_table_double_click)
         
         # Store reference to update later
-        if file_type == "video":
-            self.completed_videos_table_view = table_view
-        elif file_type == "audio":
-            self.completed_audios_table_view = table_view
-        elif file_type == "playlist":
-            self.completed_playlists_table_view = table_view
-            
+        setattr(self, f"{panel_type}_table_view", table_view)
+        self._list_panels[panel_type] = (data, model, table_view)
         return panel
 
     def create_coming_soon_panel(self, tool_name):
@@ -2195,7 +2776,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(input_frame)
 
         input_help_label = QLabel("Select a video or audio file from your computer to convert.")
-        input_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 105px;")
+        input_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        input_help_label.setContentsMargins(105, 0, 0, 0)
         input_help_label.setWordWrap(True)
         panel.layout().addWidget(input_help_label)
         
@@ -2234,7 +2816,8 @@ class MainWindow(QMainWindow):
         self._toggle_codec_dropdown_convert()
 
         format_help_label = QLabel("Choose the desired output format (e.g., mp4 for video, mp3 for audio).")
-        format_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 105px;")
+        format_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        format_help_label.setContentsMargins(105, 0, 0, 0)
         format_help_label.setWordWrap(True)
         panel.layout().addWidget(format_help_label)
         
@@ -2260,7 +2843,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(output_dir_frame)
 
         output_dir_help_label = QLabel("The converted file will be saved in this folder.")
-        output_dir_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 105px;")
+        output_dir_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        output_dir_help_label.setContentsMargins(105, 0, 0, 0)
         output_dir_help_label.setWordWrap(True)
         panel.layout().addWidget(output_dir_help_label)
         
@@ -2305,7 +2889,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(self.browser_monitor_switch)
 
         monitor_help_label = QLabel("Allows the browser extension to send download requests to the app.")
-        monitor_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 25px;")
+        monitor_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        monitor_help_label.setContentsMargins(25, 0, 0, 0)
         monitor_help_label.setWordWrap(True)
         panel.layout().addWidget(monitor_help_label)
         
@@ -2315,14 +2900,14 @@ class MainWindow(QMainWindow):
         self.go_to_extension_button.setFixedSize(250, 30)
         self.go_to_extension_button.setStyleSheet("QPushButton:focus { outline: none; }")
         self.go_to_extension_button.setCursor(Qt.PointingHandCursor)
-        self.go_to_extension_button.clicked.connect(lambda: self.show_panel(self.extension_setup_panel))
+        self.go_to_extension_button.clicked.connect(self._show_extension_setup_panel)
         panel.layout().addWidget(self.go_to_extension_button)
 
         self.go_to_download_settings_button = QPushButton("Download Settings")
         self.go_to_download_settings_button.setFixedSize(250, 30)
         self.go_to_download_settings_button.setStyleSheet("QPushButton:focus { outline: none; }")
         self.go_to_download_settings_button.setCursor(Qt.PointingHandCursor)
-        self.go_to_download_settings_button.clicked.connect(lambda: self.show_panel(self.download_settings_panel))
+        self.go_to_download_settings_button.clicked.connect(self._show_download_settings_panel)
         panel.layout().addWidget(self.go_to_download_settings_button)
 
         panel.layout().addStretch(1)
@@ -2347,7 +2932,7 @@ class MainWindow(QMainWindow):
         path_frame.layout().addWidget(path_label)
         
         self.extension_path_entry = QLineEdit()
-        self.extension_path_entry.setText(os.path.join(os.path.expanduser("~"), "Downloads", "universal_media_tool_extension"))
+        self.extension_path_entry.setText(self._default_extension_target)
         path_frame.layout().addWidget(self.extension_path_entry)
         
         self.browse_extension_dir_button = QPushButton("Browse...")
@@ -2363,7 +2948,8 @@ class MainWindow(QMainWindow):
             "After extraction, go to your browser's extensions page (e.g., `chrome://extensions/`),\n"
             "enable 'Developer mode', and click 'Load unpacked' to select the extracted folder."
         )
-        instructions.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 105px;")
+        instructions.setObjectName("helpLabel") # Styled by the window stylesheet
+        instructions.setContentsMargins(105, 0, 0, 0)
         instructions.setWordWrap(True)
         panel.layout().addWidget(instructions)
         
@@ -2382,7 +2968,7 @@ class MainWindow(QMainWindow):
         self.back_button_ext.setFixedSize(100, 30)
         self.back_button_ext.setStyleSheet("QPushButton:focus { outline: none; }")
         self.back_button_ext.setCursor(Qt.PointingHandCursor)
-        self.back_button_ext.clicked.connect(lambda: self.show_panel(self.settings_panel))
+        self.back_button_ext.clicked.connect(self._show_settings_panel)
         button_layout.addWidget(self.back_button_ext)
         panel.layout().addLayout(button_layout)
         
@@ -2422,7 +3008,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(dir_frame) # Add dir_frame to panel's layout
 
         dir_help_label = QLabel("This is the default folder where all your downloads will be saved.")
-        dir_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 125px;")
+        dir_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        dir_help_label.setContentsMargins(125, 0, 0, 0)
         dir_help_label.setWordWrap(True)
         panel.layout().addWidget(dir_help_label)
 
@@ -2432,7 +3019,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(self.overwrite_checkbox)
 
         overwrite_help_label = QLabel("If checked, new downloads will replace existing files with the same name. Otherwise, a suffix (e.g., '(1)') will be added.")
-        overwrite_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 25px;")
+        overwrite_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        overwrite_help_label.setContentsMargins(25, 0, 0, 0)
         overwrite_help_label.setWordWrap(True)
         panel.layout().addWidget(overwrite_help_label)
         
@@ -2453,7 +3041,8 @@ class MainWindow(QMainWindow):
         panel.layout().addWidget(double_click_frame) # Add double_click_frame to panel's layout
 
         double_click_help_label = QLabel("Choose what happens when you double-click a download in the list.")
-        double_click_help_label.setStyleSheet("color: #adb5bd; font-size: 11px; margin-left: 25px;")
+        double_click_help_label.setObjectName("helpLabel") # Styled by the window stylesheet
+        double_click_help_label.setContentsMargins(25, 0, 0, 0)
         double_click_help_label.setWordWrap(True)
         panel.layout().addWidget(double_click_help_label)
 
@@ -2466,7 +3055,7 @@ class MainWindow(QMainWindow):
         self.back_button_dl.setFixedSize(100, 30)
         self.back_button_dl.setStyleSheet("QPushButton:focus { outline: none; }")
         self.back_button_dl.setCursor(Qt.PointingHandCursor)
-        self.back_button_dl.clicked.connect(lambda: self.show_panel(self.settings_panel))
+        self.back_button_dl.clicked.connect(self._show_settings_panel)
         button_layout.addWidget(self.back_button_dl)
         panel.layout().addLayout(button_layout)
         
@@ -2487,6 +3076,11 @@ class MainWindow(QMainWindow):
             QLabel {
                 color: #e0e0e0;
             }
+            /* Explanatory text under settings (indent set per label via contentsMargins) */
+            QLabel#helpLabel {
+                color: #adb5bd;
+                font-size: 11px;
+            }
             /* Styling for QStackedWidget pages (main content area) */
             QWidget#contentPage {
                 background-color: #2d2d2d; /* Slightly lighter than main window */
@@ -2855,27 +3449,17 @@ class MainWindow(QMainWindow):
         # A ratio of 1:4 (200:800) for a 1000px wide window.
         main_splitter.setSizes([200, 800]) 
 
-        # Create and add all panels
-        self.active_downloads_panel = self.create_active_downloads_panel()
-        self.completed_videos_panel = self.create_completed_panel("Videos", "video")
-        self.completed_audios_panel = self.create_completed_panel("Audios", "audio")
-        self.completed_playlists_panel = self.create_completed_panel("Playlists", "playlist")
-        self.conversion_panel = self.create_coming_soon_panel("Media Converter") # MODIFIED
-        self.settings_panel = self.create_settings_panel()
-        self.extension_setup_panel = self.create_extension_setup_panel()
-        self.download_settings_panel = self.create_download_settings_panel()
+        # Create and add the always-visible panel. The completed-download, converter and
+        # settings-area panels are built lazily on first use (see completed_videos_panel etc.).
+        self._panel_types = {} # panel widget -> panel type key, used by show_panel
+        self.active_downloads_panel = self._register_panel(self.create_active_downloads_panel(), "active_downloads")
+        # panel type -> (master data list, model, table view) for the list panels that have been
+        # built; the completed panels add themselves on first use (see completed_videos_panel etc.)
+        self._list_panels = {
+            "active_downloads": (self.active_downloads_data, self.active_downloads_model, self.active_downloads_table_view),
+        }
         # self.uri_scheme_setup_panel = self.create_uri_scheme_setup_panel() # REMOVED
 
-        self.content_stacked_widget.addWidget(self.active_downloads_panel)
-        self.content_stacked_widget.addWidget(self.completed_videos_panel)
-        self.content_stacked_widget.addWidget(self.completed_audios_panel)
-        self.content_stacked_widget.addWidget(self.completed_playlists_panel)
-        self.content_stacked_widget.addWidget(self.conversion_panel)
-        self.content_stacked_widget.addWidget(self.settings_panel)
-        self.content_stacked_widget.addWidget(self.extension_setup_panel)
-        self.content_stacked_widget.addWidget(self.download_settings_panel)
-        # self.content_stacked_widget.addWidget(self.uri_scheme_setup_panel) # REMOVED
-
         # --- Status Bar ---
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar) 
@@ -2890,9 +3474,7 @@ class MainWindow(QMainWindow):
 
         self.status_bar.setStyleSheet("QStatusBar { background-color: #252526; border-top: 1px solid #3a3a3a; }")
 
-        # The initial show_panel call is now at the end of __init__
-        self.show_panel(self.active_downloads_panel)
-        self.active_downloads_button.setChecked(True)
+        # The initial show_panel call is at the end of __init__
 
 
 
@@ -2903,10 +3485,8 @@ class MainWindow(QMainWindow):
         btn.setFixedSize(100, 30) # Fixed size for consistency
         btn.setCursor(Qt.PointingHandCursor)
         
-        icon_pixmap = QPixmap()
         # Ensure icon color is explicitly set to white here
-        icon_pixmap.loadFromData(icon_svg.replace('currentColor', '#ffffff').encode('utf-8')) 
-        icon = QIcon(icon_pixmap.scaled(16, 16, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        icon = QIcon(render_svg_pixmap(icon_svg, '#ffffff', 16, 16))
         btn.setIcon(icon)
         btn.setIconSize(icon.actualSize(btn.size()))
         
@@ -2931,13 +3511,16 @@ class MainWindow(QMainWindow):
         self.settings_button.clicked.connect(lambda: self.show_panel(self.settings_panel))
 
         # Connect internal signals for GUI updates from Flask threads
-        self.add_download_signal.connect(self.add_download_to_list)
-        self.update_download_status_signal.connect(self.update_download_status_in_list)
-        self.add_completed_signal.connect(self.add_completed_download)
+        # The download signals are only emitted by the queue drain on the GUI thread and must run
+        # in order with the rest of the drain, so they are direct calls
+        self.add_download_signal.connect(self.add_download_to_list, Qt.DirectConnection)
+        self.update_download_status_signal.connect(self.update_download_status_in_list, Qt.DirectConnection)
+        self.add_completed_signal.connect(self.add_completed_download, Qt.DirectConnection)
         # self.add_conversion_signal.connect(self.add_conversion_to_list) # Commented out
         # self.update_conversion_status_signal.connect(self.update_conversion_status_in_list) # Commented out
-        self.show_status_signal.connect(self.show_status)
-        self.set_buttons_disabled_signal.connect(self.set_all_buttons_disabled)
+        # Emitted from worker threads: always hand over to the GUI thread's event loop
+        self.show_status_signal.connect(self.show_status, Qt.QueuedConnection)
+        self.set_buttons_disabled_signal.connect(self.set_all_buttons_disabled, Qt.QueuedConnection)
 
         # Connect action buttons
         self.delete_button.clicked.connect(self.delete_selected_items)
@@ -2948,22 +3531,17 @@ class MainWindow(QMainWindow):
 
         # --- ADDED: Connect double-click signals for all table views ---
         self.active_downloads_table_view.doubleClicked.connect(self.handle_table_double_click)
-        self.completed_videos_table_view.doubleClicked.connect(self.handle_table_double_click)
-        self.completed_audios_table_view.doubleClicked.connect(self.handle_table_double_click)
-        self.completed_playlists_table_view.doubleClicked.connect(self.handle_table_double_click)
 
-    def _add_process_to_tracker(self, url, process_info):
+    def _add_process_to_tracker(self, url, process, cancel_event):
         """Adds a running subprocess and its cancel event to the tracker."""
-        # process_info is expected to be {'process': Popen_object, 'cancel_event': threading.Event}
-        self.active_processes[url] = process_info
-        print(f"DEBUG: Process info added for URL: {url}")
+        self.active_processes[url] = TrackedProcess(process, cancel_event)
+        logger.debug("Process info added for URL: %s", url)
 
 
     def _remove_process_from_tracker(self, url):
         """Removes a process from the tracker."""
-        if url in self.active_processes:
-            del self.active_processes[url]
-            print(f"DEBUG: Process removed for URL: {url}")
+        if self.active_processes.pop(url, None) is not None:
+            logger.debug("Process removed for URL: %s", url)
 
 
     def handle_table_double_click(self, index):
@@ -2972,10 +3550,11 @@ class MainWindow(QMainWindow):
         if not selected_item:
             return # No item selected, nothing to do
 
-        # Use settings.get to retrieve the action
-        if settings.get('double_click_action') == "Open folder":
+        # Read the action once: each settings.get takes the settings lock
+        action = settings.get('double_click_action')
+        if action == "Open folder":
             self.open_selected_folder()
-        elif settings.get('double_click_action') == "Open file":
+        elif action == "Open file":
             self.open_selected_file()
         else:
             self.show_status("Unknown double-click action configured.", "error")
@@ -2985,13 +3564,13 @@ class MainWindow(QMainWindow):
         logger.info("Application closing. Initiating shutdown sequence.")
         
         # Cancel all active downloads
-        for url, process_info in list(self.active_processes.items()):
+        for url, tracked in list(self.active_processes.items()):
             try:
-                cancel_event = process_info.get('cancel_event')
+                cancel_event = tracked.cancel_event
                 if cancel_event:
                     cancel_event.set() # Signal the thread to stop
                     
-                process = process_info.get('process')
+                process = tracked.process
                 if process and process.poll() is None: # If process is still running
                     if sys.platform == 'win32':
                         # On Windows, use taskkill /F /T to forcefully terminate process tree
@@ -3000,27 +3579,20 @@ class MainWindow(QMainWindow):
                                        creationflags=subprocess.CREATE_NO_WINDOW,
                                        stdout=DEVNULL, stderr=DEVNULL)
                     else:
-                        process.terminate() # Send SIGTERM
-                        try:
-                            process.wait(timeout=1) # Give it a moment to terminate
-                        except subprocess.TimeoutExpired:
-                            process.kill() # Force kill if it doesn't respond
+                        stop_download_process(process, timeout=1) # SIGTERM the group, then SIGKILL
                 logger.info(f"Cleaned up process for {url} during close.")
             except Exception as e:
                 logger.error(f"Error cleaning up process for {url} during close: {e}")
         
         # Shutdown Flask server
         try:
-            logger.info(f"Sending shutdown request to Flask server on port {FLASK_PORT}...")
-            # Use a short timeout for the shutdown request
-            requests.post(f"http://localhost:{FLASK_PORT}/shutdown", timeout=1) 
-            logger.info("Flask shutdown request sent.")
-        except requests.exceptions.ConnectionError:
-            logger.warning("Could not connect to Flask server for shutdown (might already be down or never started).")
-        except requests.exceptions.Timeout:
-            logger.warning("Flask server shutdown request timed out.")
+            logger.info(f"Stopping Flask server on port {FLASK_PORT}...")
+            if stop_flask_server(timeout=1):
+                logger.info("Flask server stopped.")
+            else:
+                logger.warning("Flask server thread did not stop in time.")
         except Exception as e:
-            logger.error(f"Error sending Flask shutdown request: {e}")
+            logger.error(f"Error stopping Flask server: {e}")
         
         event.accept() # Accept the close event
 
@@ -3034,64 +3606,74 @@ class MainWindow(QMainWindow):
                 self.show_status_signal.emit(message, msg_type, timeout_ms)
                 return
             
-            # This part runs only in the GUI thread
-            self.status_label.setText(message)
+            # This part runs only in the GUI thread.
+            # Drop repeats of the message that is already showing (e.g. bursts of failures)
+            now = time.monotonic()
+            if (message, msg_type) == self._last_status and now - self._last_status_time < 0.5:
+                return
+            self._last_status = (message, msg_type)
+            self._last_status_time = now
+
+            # Show at most one status every 250 ms; the latest pending one wins
+            self._pending_status = (message, msg_type, timeout_ms)
+            if not self.status_debounce_timer.isActive():
+                self._apply_pending_status()
+                self.status_debounce_timer.start()
+
+    def _apply_pending_status(self):
+        """Displays the most recent status passed to show_status."""
+        if self._pending_status is None:
+            return
+        message, msg_type, timeout_ms = self._pending_status
+        self._pending_status = None
+        if self.status_bar.isHidden():
+            return
+
+        self.status_label.setText(message)
+        if msg_type != self._status_style_type: # Stylesheet changes force a style recalculation
+            self._status_style_type = msg_type
             if msg_type == 'success':
                 self.status_label.setStyleSheet("color: #4dabf7; font-size: 12px;") # Accent color
             elif msg_type == 'error':
                 self.status_label.setStyleSheet("color: #ff6b6b; font-size: 12px;") # Red for error
             else:
                 self.status_label.setStyleSheet("color: #adb5bd; font-size: 12px;") # Default gray
-            
-            # Start or restart the timer to clear the message
+        
+        # Push the clear deadline out; only restart the timer if it would otherwise fire too late
+        self._status_deadline = time.monotonic() + timeout_ms / 1000
+        if not self.status_clear_timer.isActive() or self.status_clear_timer.remainingTime() > timeout_ms:
             self.status_clear_timer.start(timeout_ms)
-            QApplication.processEvents() # Ensure immediate update
+
+    @Slot()
+    def _on_status_clear_timeout(self):
+        """Clears the status bar once its deadline has passed, else waits out the remainder."""
+        remaining_ms = int((self._status_deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self.status_clear_timer.start(remaining_ms)
+        else:
+            self._clear_status_bar()
 
     def _clear_status_bar(self):
         """Clears the status bar message and resets its style."""
+        self._last_status = None
         self.status_label.setText("Ready")
-        self.status_label.setStyleSheet("color: #adb5bd; font-size: 12px;")
-        QApplication.processEvents() # Ensure immediate update
+        if self._status_style_type != 'info':
+            self._status_style_type = 'info'
+            self.status_label.setStyleSheet("color: #adb5bd; font-size: 12px;")
 
 
     def set_all_buttons_disabled(self, disabled):
         """Disables/enables all relevant GUI buttons to prevent concurrent operations."""
-        # A more robust way to disable all actionable widgets
-        widgets_to_disable = [
-            # Sidebar
-            self.active_downloads_button, self.completed_videos_button,
-            self.completed_audios_button, self.completed_playlists_button,
-            self.convert_media_button, self.add_download_button_nav,
-            self.settings_button, 
-            # Top bar actions
-            self.delete_button, self.open_button, self.open_folder_button,
-            self.cancel_button, self.refresh_button,
-            # Search
-            self.search_input,
-            # Conversion Panel (Now handled by the placeholder panel, but keeping these commented for future)
-            # self.browse_input_file_button, self.output_format_dropdown,
-            # self.browse_output_dir_button, self.start_conversion_button,
-            # self.video_codec_dropdown, self.back_button_convert,
-            # Settings Panel
-            self.browser_monitor_switch, self.go_to_extension_button,
-            self.go_to_download_settings_button,
-            # self.go_to_uri_scheme_button, # REMOVED
-            # Extension Setup Panel
-            self.browse_extension_dir_button, self.extract_extension_button, self.back_button_ext,
-            # Download Settings Panel
-            self.browse_default_download_dir_button, self.overwrite_checkbox,
-            self.double_click_action_dropdown, self.back_button_dl,
-            # URI Scheme Panel
-            # self.back_button_uri, # REMOVED
-        ]
-        
-        for widget in widgets_to_disable:
-            # Check if widget exists before trying to disable it
-            if widget and hasattr(widget, 'setEnabled'):
-                widget.setEnabled(not disabled)
+        # Disabling a container disables every widget inside it, so lock the containers
+        # instead of each button: the sidebar, the top bar (actions + search) and whichever
+        # settings-area panels have been built (cached_property stores them in __dict__).
+        containers = [self.sidebar_frame, self.content_top_bar]
+        containers.extend(self.__dict__[name] for name in self.LOCKABLE_LAZY_PANELS if name in self.__dict__)
+        for container in containers:
+            container.setEnabled(not disabled)
         
         # Handle dialog buttons if open
-        if hasattr(self, 'add_download_dialog') and self.add_download_dialog.isVisible():
+        if 'add_download_dialog' in self.__dict__ and self.add_download_dialog.isVisible():
             self.add_download_dialog.url_entry.setEnabled(not disabled)
             for radio_btn in self.add_download_dialog.media_type_group.buttons():
                 radio_btn.setEnabled(not disabled)
@@ -3099,13 +3681,82 @@ class MainWindow(QMainWindow):
             self.add_download_dialog.cancel_button.setEnabled(not disabled)
 
 
+    def _register_panel(self, panel, panel_type):
+        """Adds a panel to the content stack and records its type for show_panel."""
+        self.content_stacked_widget.addWidget(panel)
+        self._panel_types[panel] = panel_type
+        return panel
+
+    # --- Dialogs: built on first use and reused for every later prompt ---
+    @functools.cached_property
+    def add_download_dialog(self):
+        return AddDownloadDialog(self)
+
+    @functools.cached_property
+    def confirmation_dialog(self):
+        return ConfirmationDialog(parent=self)
+
+    def confirm(self, message):
+        """Asks a yes/no question with the shared confirmation dialog; True when confirmed."""
+        self.confirmation_dialog.set_message(message)
+        return self.confirmation_dialog.exec() == QDialog.Accepted
+
+    # --- Lazily built panels: constructed and added to the stack the first time they are shown ---
+    LOCKABLE_LAZY_PANELS = ('settings_panel', 'extension_setup_panel', 'download_settings_panel')
+
+    @functools.cached_property
+    def conversion_panel(self):
+        return self._register_panel(self.create_coming_soon_panel("Media Converter"), "conversion")
+
+    @functools.cached_property
+    def completed_videos_panel(self):
+        return self._register_panel(self.create_completed_panel("Videos", "video"), "completed_videos")
+
+    @functools.cached_property
+    def completed_audios_panel(self):
+        return self._register_panel(self.create_completed_panel("Audios", "audio"), "completed_audios")
+
+    @functools.cached_property
+    def completed_playlists_panel(self):
+        return self._register_panel(self.create_completed_panel("Playlists", "playlist"), "completed_playlists")
+
+    @functools.cached_property
+    def settings_panel(self):
+        return self._register_panel(self.create_settings_panel(), "settings")
+
+    @functools.cached_property
+    def extension_setup_panel(self):
+        return self._register_panel(self.create_extension_setup_panel(), "extension_setup")
+
+    @functools.cached_property
+    def download_settings_panel(self):
+        return self._register_panel(self.create_download_settings_panel(), "download_settings")
+
+    # Dedicated slots for the settings-area navigation buttons (no per-button lambdas)
+    @Slot()
+    def _show_settings_panel(self):
+        self.show_panel(self.settings_panel)
+
+    @Slot()
+    def _show_extension_setup_panel(self):
+        self.show_panel(self.extension_setup_panel)
+
+    @Slot()
+    def _show_download_settings_panel(self):
+        self.show_panel(self.download_settings_panel)
+
     def show_panel(self, panel_to_show):
         """Switches the main content area to display the specified panel."""
+        if panel_to_show is self._shown_panel:
+            return # Already showing and set up; nothing to redo
+        self._shown_panel = panel_to_show
+
         # Uncheck all buttons in the group first to ensure exclusive selection
         for button in self.sidebar_button_group.buttons():
             button.setChecked(False)
 
         self.content_stacked_widget.setCurrentWidget(panel_to_show)
+        panel_type = self._panel_types.get(panel_to_show)
         
         # Hide all action buttons first
         self.delete_button.setVisible(False)
@@ -3116,10 +3767,11 @@ class MainWindow(QMainWindow):
         self.search_input.setVisible(False) # Hide search by default
 
         # Update current panel type for search filtering and set the correct button as checked
-        if panel_to_show == self.active_downloads_panel:
+        if panel_type == "active_downloads":
             self.current_panel_type = "active_downloads"
             self.active_downloads_button.setChecked(True)
             self.active_downloads_table_view.setModel(self.active_downloads_model) # Ensure correct model is set
+            self.filter_displayed_items(self.search_input.text()) # Pick up items added while hidden
             self.active_downloads_table_view.sortByColumn(0, Qt.AscendingOrder) # Default sort by name
             
             # Show relevant action buttons for Active Downloads
@@ -3130,10 +3782,11 @@ class MainWindow(QMainWindow):
             self.cancel_button.setVisible(True)
             self.refresh_button.setVisible(True)
 
-        elif panel_to_show == self.completed_videos_panel:
+        elif panel_type == "completed_videos":
             self.current_panel_type = "completed_videos"
             self.completed_videos_button.setChecked(True)
             self.completed_videos_table_view.setModel(self.completed_videos_model) # Ensure correct model is set
+            self.filter_displayed_items(self.search_input.text()) # Pick up items added while hidden
             self.completed_videos_table_view.sortByColumn(1, Qt.DescendingOrder) # Default sort by date desc
             
             # Show relevant action buttons for Completed Videos
@@ -3143,10 +3796,11 @@ class MainWindow(QMainWindow):
             self.open_folder_button.setVisible(True)
             self.refresh_button.setVisible(True)
 
-        elif panel_to_show == self.completed_audios_panel:
+        elif panel_type == "completed_audios":
             self.current_panel_type = "completed_audios"
             self.completed_audios_button.setChecked(True)
             self.completed_audios_table_view.setModel(self.completed_audios_model) # Ensure correct model is set
+            self.filter_displayed_items(self.search_input.text()) # Pick up items added while hidden
             self.completed_audios_table_view.sortByColumn(1, Qt.DescendingOrder) # Default sort by date desc
             
             # Show relevant action buttons for Completed Audios
@@ -3156,10 +3810,11 @@ class MainWindow(QMainWindow):
             self.open_folder_button.setVisible(True)
             self.refresh_button.setVisible(True)
 
-        elif panel_to_show == self.completed_playlists_panel:
+        elif panel_type == "completed_playlists":
             self.current_panel_type = "completed_playlists"
             self.completed_playlists_button.setChecked(True)
             self.completed_playlists_table_view.setModel(self.completed_playlists_model) # Ensure correct model is set
+            self.filter_displayed_items(self.search_input.text()) # Pick up items added while hidden
             self.completed_playlists_table_view.sortByColumn(1, Qt.DescendingOrder) # Default sort by date desc
             
             # Show relevant action buttons for Completed Playlists
@@ -3169,21 +3824,21 @@ class MainWindow(QMainWindow):
             self.open_folder_button.setVisible(True)
             self.refresh_button.setVisible(True)
 
-        elif panel_to_show == self.conversion_panel:
+        elif panel_type == "conversion":
             self.current_panel_type = "conversion"
             self.convert_media_button.setChecked(True)
             # No update needed for "Coming Soon" panel
 
-        elif panel_to_show == self.settings_panel:
+        elif panel_type == "settings":
             self.current_panel_type = "settings"
             self.settings_button.setChecked(True) # Now part of button group
             self.update_settings_display() # Explicitly update when shown
 
-        elif panel_to_show == self.extension_setup_panel:
+        elif panel_type == "extension_setup":
             self.current_panel_type = "extension_setup"
             self.update_extension_setup_display() # Explicitly update when shown
 
-        elif panel_to_show == self.download_settings_panel:
+        elif panel_type == "download_settings":
             self.current_panel_type = "download_settings"
             self.update_download_settings_display() # Explicitly update when shown
 
@@ -3196,75 +3851,28 @@ class MainWindow(QMainWindow):
         """Filters items in the currently displayed list based on the search query."""
         search_query = search_query.lower().strip()
 
-        source_data = None
-        current_model = None
-        current_table_view = None
-
-        if self.current_panel_type == "active_downloads":
-            source_data = self.active_downloads_data
-            current_model = self.active_downloads_model
-            current_table_view = self.active_downloads_table_view
-        elif self.current_panel_type == "completed_videos":
-            source_data = self.completed_videos_data
-            current_model = self.completed_videos_model
-            current_table_view = self.completed_videos_table_view
-        elif self.current_panel_type == "completed_audios":
-            source_data = self.completed_audios_data
-            current_model = self.completed_audios_model
-            current_table_view = self.completed_audios_table_view
-        elif self.current_panel_type == "completed_playlists":
-            source_data = self.completed_playlists_data
-            current_model = self.completed_playlists_model
-            current_table_view = self.completed_playlists_table_view
-        else:
+        list_panel = self._list_panels.get(self.current_panel_type)
+        if list_panel is None:
             return # No filtering for other panels
+        source_data, current_model, current_table_view = list_panel
 
-        filtered_data = []
         if search_query:
-            for item_info in source_data:
-                # Search in filename, URL, status, type (for completed)
-                search_text = (
-                    item_info.get('filename', '').lower() + 
-                    item_info.get('url', '').lower() + 
-                    item_info.get('status', '').lower() + 
-                    item_info.get('filetype', '').lower()
-                )
-                if search_query in search_text:
-                    filtered_data.append(item_info)
+            # Search in filename, URL, status, type (for completed); the lowered text is cached per item
+            filtered_data = [item_info for item_info in source_data if search_query in _search_text(item_info)]
         else:
             filtered_data = source_data[:] # Show all, use a copy
 
-        current_model.setFilteredData(filtered_data) # <--- Using setFilteredData
-        
-        # Re-apply current sort order after filtering
-        sort_column = current_table_view.horizontalHeader().sortIndicatorSection()
-        sort_order = current_table_view.horizontalHeader().sortIndicatorOrder()
-        if sort_column != -1:
-            current_model.sort(sort_column, sort_order)
-
-        QApplication.processEvents() # Force redraw
+        # Keep the current sort order; the model sorts the filtered rows as part of the reset
+        header = current_table_view.horizontalHeader()
+        current_model.setFilteredData(filtered_data, header.sortIndicatorSection(), header.sortIndicatorOrder())
 
 
     # --- Action Button Implementations ---
     def _get_selected_item_data(self):
         """Helper to get data for the currently selected row in the active table view."""
-        current_table_view = None
-        current_model = None
-
-        if self.current_panel_type == "active_downloads":
-            current_table_view = self.active_downloads_table_view
-            current_model = self.active_downloads_model
-        elif self.current_panel_type == "completed_videos":
-            current_table_view = self.completed_videos_table_view
-            current_model = self.completed_videos_model
-        elif self.current_panel_type == "completed_audios":
-            current_table_view = self.completed_audios_table_view
-            current_model = self.completed_audios_model
-        elif self.current_panel_type == "completed_playlists":
-            current_table_view = self.completed_playlists_table_view
-            current_model = self.completed_playlists_model
-        
-        if current_table_view and current_model:
+        list_panel = self._list_panels.get(self.current_panel_type)
+        if list_panel is not None:
+            _, current_model, current_table_view = list_panel
             selected_indexes = current_table_view.selectionModel().selectedRows()
             if selected_indexes:
                 # Assuming single selection for these actions
@@ -3274,38 +3882,66 @@ class MainWindow(QMainWindow):
                     return current_model._data[row]
         return None
 
+    def _get_selected_items_data(self):
+        """Returns the data of every selected row in the active table view, in row order."""
+        list_panel = self._list_panels.get(self.current_panel_type)
+        if list_panel is None:
+            return []
+        _, current_model, current_table_view = list_panel
+        rows = sorted(index.row() for index in current_table_view.selectionModel().selectedRows())
+        data = current_model._data
+        return [data[row] for row in rows if row < len(data)]
+
     def delete_selected_items(self):
-        """Deletes selected download items from the current view."""
-        selected_item = self._get_selected_item_data()
-        if not selected_item:
+        """Deletes the selected download items from the current view, after one confirmation."""
+        selected_items = self._get_selected_items_data()
+        if not selected_items:
             self.show_status("No item selected to delete.", "info")
             return
         
         # Implement a custom confirmation dialog instead of QMessageBox
-        confirm_dialog = ConfirmationDialog(f"Are you sure you want to delete '{selected_item.get('filename', 'this item')}'?", self)
-        if confirm_dialog.exec() == QDialog.Accepted:
-            url_to_delete = selected_item.get('url')
-            
+        if len(selected_items) == 1:
+            prompt = f"Are you sure you want to delete '{selected_items[0].get('filename', 'this item')}'?"
+        else:
+            prompt = f"Are you sure you want to delete {len(selected_items)} items?"
+        if self.confirm(prompt):
+            what = f"'{selected_items[0].get('filename')}'" if len(selected_items) == 1 else f"{len(selected_items)} items"
             if self.current_panel_type == "active_downloads":
-                self.active_downloads_model.removeItem(url_to_delete)
-                self.show_status(f"Download '{selected_item.get('filename')}' removed.", "success")
+                self._pop_active_downloads({item.get('url') for item in selected_items})
+                self.active_downloads_model.removeEntries(selected_items)
+                self.show_status(f"Download {what} removed.", "success")
                 # In a real app, you might also need to send a signal to Flask to stop/cancel the download process
                 # if it's still active.
             elif self.current_panel_type in ["completed_videos", "completed_audios", "completed_playlists"]:
-                # Determine which completed model to remove from
-                if selected_item.get('filetype') == 'video':
-                    self.completed_videos_model.removeItem(url_to_delete)
-                elif selected_item.get('filetype') == 'audio':
-                    self.completed_audios_model.removeItem(url_to_delete)
-                elif selected_item.get('filetype') == 'playlist':
-                    self.completed_playlists_model.removeItem(url_to_delete)
-                self.show_status(f"Completed item '{selected_item.get('filename')}' deleted.", "success")
-            
-            # Re-filter to update display
-            self.filter_displayed_items(self.search_input.text())
+                # The selected items belong to the list of the panel they were selected in
+                completed_data, completed_model, _ = self._list_panels[self.current_panel_type]
+                ids = {id(item) for item in selected_items}
+                completed_data[:] = [item for item in completed_data if id(item) not in ids]
+                completed_model.removeEntries(selected_items)
+                self.show_status(f"Completed item {what} deleted.", "success")
+            # The model removed exactly these rows, so the filtered display needs no rebuild
         else:
             self.show_status("Deletion cancelled.", "info")
 
+    def _open_local_path(self, path):
+        """Opens a file or folder with its default application without blocking the GUI.
+
+        On Windows the shell can stall while resolving file associations, so os.startfile runs
+        on a pool thread there; elsewhere QDesktopServices just spawns an opener process.
+        """
+        if sys.platform == 'win32':
+            self.thread_pool.start(FunctionRunnable(self._start_file, path))
+        else:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+    def _start_file(self, path):
+        """Runs on a thread-pool worker (Windows only)."""
+        try:
+            os.startfile(path)
+        except OSError as e:
+            logger.error(f"Could not open {path}: {e}")
+            self.show_status_signal.emit(f"Could not open {os.path.basename(path)}: {e}", "error", 5000)
+
     def open_selected_file(self):
         """Opens the file associated with the selected download item."""
         selected_item = self._get_selected_item_data()
@@ -3315,7 +3951,7 @@ class MainWindow(QMainWindow):
         
         file_path = selected_item.get('path')
         if file_path and os.path.exists(file_path):
-            QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+            self._open_local_path(file_path)
             self.show_status(f"Opening file: {os.path.basename(file_path)}", "info")
         else:
             self.show_status(f"File not found: {selected_item.get('filename', 'N/A')}. Path: {file_path}", "error")
@@ -3329,12 +3965,10 @@ class MainWindow(QMainWindow):
         
         file_path = selected_item.get('path')
         if file_path and os.path.exists(file_path):
+            # An existing path's parent exists too, so it needs no second stat
             folder_path = os.path.dirname(file_path)
-            if os.path.exists(folder_path):
-                QDesktopServices.openUrl(QUrl.fromLocalFile(folder_path))
-                self.show_status(f"Opening folder: {folder_path}", "info")
-            else:
-                self.show_status(f"Folder not found for: {selected_item.get('filename', 'N/A')}. Path: {folder_path}", "error")
+            self._open_local_path(folder_path)
+            self.show_status(f"Opening folder: {folder_path}", "info")
         else:
             self.show_status(f"File path not available for: {selected_item.get('filename', 'N/A')}", "error")
 
@@ -3347,67 +3981,61 @@ class MainWindow(QMainWindow):
         
         url_to_cancel = selected_item.get('url')
 
-        confirm_dialog = ConfirmationDialog(f"Are you sure you want to cancel '{selected_item.get('filename', 'this download')}'?", self)
-        if confirm_dialog.exec() == QDialog.Accepted:
+        if self.confirm(f"Are you sure you want to cancel '{selected_item.get('filename', 'this download')}'?"):
             # Attempt to terminate the subprocess
-            if url_to_cancel in self.active_processes:
-                process_info = self.active_processes[url_to_cancel]
-                process_to_terminate = process_info.get('process')
-                cancel_event = process_info.get('cancel_event')
+            tracked = self.active_processes.get(url_to_cancel)
+            if tracked is not None:
+                process_to_terminate = tracked.process
+                cancel_event = tracked.cancel_event
 
                 if not cancel_event:
                     self.show_status(f"Error: No cancellation event found for '{selected_item.get('filename')}'", "error")
                     return
 
-                try:
-                    # 1. Set the internal cancellation event
-                    cancel_event.set()
-                    print(f"DEBUG: Set cancellation event for {url_to_cancel}")
-
-                    if process_to_terminate and process_to_terminate.poll() is None: # Only try to terminate if still running
-                        if sys.platform == 'win32':
-                            # On Windows, use taskkill /F /T to forcefully terminate process tree
-                            print(f"DEBUG: Attempting to terminate process tree (PID: {process_to_terminate.pid}) for {url_to_cancel} using taskkill.")
-                            subprocess.run(['taskkill', '/F', '/T', '/PID', str(process_to_terminate.pid)], 
-                                           check=False,
-                                           creationflags=subprocess.CREATE_NO_WINDOW,
-                                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                            time.sleep(0.1) # Give OS a moment
-                        else:
-                            process_to_terminate.terminate() 
-                            print(f"DEBUG: Sent terminate signal to process for {url_to_cancel}")
-                            try:
-                                process_to_terminate.wait(timeout=5)
-                                if process_to_terminate.poll() is None:
-                                    print(f"DEBUG: Process for {url_to_cancel} did not terminate gracefully, forcing kill.")
-                                    process_to_terminate.kill()
-                                    process_to_terminate.wait()
-                            except subprocess.TimeoutExpired:
-                                print(f"DEBUG: Process for {url_to_cancel} timed out during graceful termination, forcing kill.")
-                                process_to_terminate.kill()
-                                process_to_terminate.wait()
-                    else:
-                        print(f"DEBUG: Process for {url_to_cancel} was already terminated or not found when cancel was clicked.")
+                # Signal the download thread now; the process is stopped on a pool thread because
+                # taskkill / wait(timeout=5) would otherwise freeze the GUI
+                cancel_event.set()
+                logger.debug("Set cancellation event for %s", url_to_cancel)
+                if process_to_terminate is None:
+                    # Still queued for a download worker, which will skip it: finish the cancel here
+                    # rather than leaving the row at 'Cancelling...' until a worker frees up
+                    self.update_download_status_in_list(url_to_cancel, {'status': 'Cancelled', 'message': 'Download cancelled by user.'})
+                    return
+                if process_to_terminate and process_to_terminate.poll() is None: # Only try to terminate if still running
+                    self.thread_pool.start(FunctionRunnable(self._terminate_download_process, url_to_cancel, process_to_terminate))
+                else:
+                    logger.debug("Process for %s was already terminated or not found when cancel was clicked.", url_to_cancel)
 
-                    # Update GUI status immediately to show it's being cancelled
-                    self.active_downloads_model.updateItem(url_to_cancel, {'status': 'Cancelling...', 'progress': '0%', 'message': 'Cancellation requested.'})
-                    self.show_status(f"Cancellation requested for '{selected_item.get('filename')}'", "info")
-                    
-                    # The _perform_yt_dlp_download thread will handle the final 'Cancelled' status
-                    # and removal from active_downloads_model once it fully exits.
-                    
-                except Exception as e:
-                    self.show_status(f"Error during cancellation attempt: {e}", "error")
-                    print(f"Error during cancellation attempt for {url_to_cancel}: {e}")
-                    # If an error occurs here, ensure it's removed from tracker and GUI
-                    self._remove_process_from_tracker(url_to_cancel)
-                    self.active_downloads_model.removeItem(url_to_cancel) 
+                # Update GUI status immediately to show it's being cancelled
+                self.active_downloads_model.updateItem(url_to_cancel, {'status': 'Cancelling...', 'progress': '0%', 'message': 'Cancellation requested.'})
+                self.show_status(f"Cancellation requested for '{selected_item.get('filename')}'", "info")
+                
+                # The _perform_yt_dlp_download thread will handle the final 'Cancelled' status
+                # and removal from active_downloads_model once it fully exits.
             else:
                 self.show_status(f"No active process found for '{selected_item.get('filename')}'", "info")
+                self._pop_active_download(url_to_cancel)
                 self.active_downloads_model.removeItem(url_to_cancel) 
         else:
             self.show_status("Cancellation aborted.", "info")
 
+    def _terminate_download_process(self, url, process):
+        """Stops a cancelled download's yt-dlp process. Runs on a thread-pool worker."""
+        try:
+            if sys.platform == 'win32':
+                # On Windows, use taskkill /F /T to forcefully terminate process tree
+                logger.debug("Attempting to terminate process tree (PID: %s) for %s using taskkill.", process.pid, url)
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], 
+                               check=False,
+                               creationflags=subprocess.CREATE_NO_WINDOW,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            else:
+                logger.debug("Terminating process group (PID: %s) for %s.", process.pid, url)
+                stop_download_process(process)
+        except Exception as e:
+            logger.exception("Error during cancellation attempt for %s", url)
+            self.show_status_signal.emit(f"Error during cancellation attempt: {e}", "error", 5000)
+
     def refresh_current_view(self):
         self.filter_displayed_items(self.search_input.text())
         self.show_status("View refreshed.", "info")
@@ -3438,14 +4066,17 @@ class MainWindow(QMainWindow):
 
     def clear_completed_list(self, file_type):
         """Clears the completed downloads list for a specific type"""
+        # Empty the master list in place (show_panel/filtering re-read it) and reset the model once
         if file_type == "video":
+            self.completed_videos_data.clear()
             self.completed_videos_model.clearAll()
         elif file_type == "audio":
+            self.completed_audios_data.clear()
             self.completed_audios_model.clearAll()
         elif file_type == "playlist":
+            self.completed_playlists_data.clear()
             self.completed_playlists_model.clearAll()
         self.show_status(f"Cleared completed {file_type}s", "success")
-        QApplication.processEvents()
 
     # def update_conversion_display(self): # Commented out
     #     self.conversion_input_file_entry.setText(os.path.basename(self.convert_input_file) if self.convert_input_file else "")
@@ -3454,20 +4085,17 @@ class MainWindow(QMainWindow):
     #     QApplication.processEvents()
 
     def update_settings_display(self):
-        logger.debug(f"update_settings_display called. Reading browser_monitor_enabled: {settings.get('browser_monitor_enabled')}")
+        logger.debug("update_settings_display called. Reading browser_monitor_enabled: %s", settings.get('browser_monitor_enabled'))
         self.browser_monitor_switch.setChecked(settings.get('browser_monitor_enabled'))
-        QApplication.processEvents()
 
     def update_download_settings_display(self):
         # Use settings.get() for all these values
         self.default_download_dir_entry.setText(settings.get('download_save_directory'))
         self.overwrite_checkbox.setChecked(settings.get('overwrite_existing_file'))
         self.double_click_action_dropdown.setCurrentText(settings.get('double_click_action'))
-        QApplication.processEvents()
 
     def update_extension_setup_display(self):
-        self.extension_path_entry.setText(os.path.join(os.path.expanduser("~"), "Downloads", "universal_media_tool_extension"))
-        QApplication.processEvents()
+        self.extension_path_entry.setText(self._default_extension_target)
 
 
     # def update_uri_scheme_setup_display(self): # REMOVED
@@ -3477,38 +4105,35 @@ class MainWindow(QMainWindow):
     def add_download_to_list(self, download_info):
         """Adds a new download entry to the active downloads list in the GUI."""
         # Use the master data list for the check
-        if not any(d['url'] == download_info['url'] for d in self.active_downloads_data):
+        if download_info['url'] not in self._active_index:
             self.active_downloads_data.append(download_info)
-            # --- FIX: Show it immediately in the active-downloads table if that panel is current ---
+            self._active_index[download_info['url']] = len(self.active_downloads_data) - 1
+            # Show it immediately if the active-downloads table is current; otherwise
+            # show_panel() picks it up from the master list when the panel is shown.
             if self.current_panel_type == 'active_downloads':
                 self.active_downloads_model.addItem(download_info)
-            else:
-                # If not on the active downloads panel, update its display so it's ready when switched to
-                self.update_active_downloads_display()
-            # --- END FIX ---
             self.show_status(f"Download added: {download_info.get('filename', download_info.get('url'))}", "info")
-        QApplication.processEvents()
 
 
 
     def update_download_status_in_list(self, url, new_data_dict):
         """Updates an existing download entry in the GUI. Does NOT add new entries."""
-        # Check if the download already exists by URL in the active_downloads_data (master list)
-        found_index = -1
-        for i, item in enumerate(self.active_downloads_data):
-            if item.get('url') == url:
-                found_index = i
-                break
-
-        if found_index != -1:
+        found_index = self._active_index.get(url)
+
+        if found_index is not None:
             # Update existing entry in the master data list
             current_data = self.active_downloads_data[found_index]
-            current_data.update(new_data_dict) # Merge new data into existing
+            # Stalled downloads repeat the same tick; keep only fields that actually change
+            changed = {key: value for key, value in new_data_dict.items()
+                       if key not in current_data or current_data[key] != value}
+            if not changed:
+                return
+            current_data.update(changed) # Merge new data into existing
             
             # Now, update the model. The model might be filtered, so we need to ensure
             # the update propagates correctly to the currently displayed items.
             # The DownloadTableModel.updateItem method will handle emitting dataChanged.
-            self.active_downloads_model.updateItem(url, new_data_dict)
+            self.active_downloads_model.updateItem(url, changed)
         else:
             logger.warning(f"Received update for unknown download URL: {url}. Data: {new_data_dict}")
 
@@ -3526,42 +4151,73 @@ class MainWindow(QMainWindow):
             # Remove from active_downloads_data if terminal status
             # This ensures the master list doesn't retain failed/cancelled items.
             # The model's removeItem will also update the view.
-            self.active_downloads_data[:] = [d for d in self.active_downloads_data if d.get('url') != url]
+            self._pop_active_download(url)
             self.active_downloads_model.removeItem(url)
             self._remove_process_from_tracker(url) # Ensure process is also removed from tracker
         
-        QApplication.processEvents() # Force GUI redraw
 
 
 
     def add_completed_download(self, download_info):
         """Adds a completed download to the appropriate completed list and removes it from active."""
-        filetype = download_info.get('filetype', 'unknown')
-        
+        self.complete_many([download_info])
+
+    def complete_many(self, completed_infos):
+        """Moves a batch of finished downloads from the active list to their completed lists.
+
+        Each completed model gets a single insert notification and the active model one removal
+        per contiguous run of rows, instead of a remove + insert pair per download.
+        """
+        if not completed_infos:
+            return
+
+        targets = {
+            'video': (self.completed_videos_data, self.completed_videos_model, 'completed_videos'),
+            'audio': (self.completed_audios_data, self.completed_audios_model, 'completed_audios'),
+            'playlist': (self.completed_playlists_data, self.completed_playlists_model, 'completed_playlists'),
+        }
+        batches = {}
+        for download_info in completed_infos:
+            filetype = download_info.get('filetype', 'unknown')
+            if filetype not in targets:
+                logger.warning(f"Unknown filetype '{filetype}' for completed download: {download_info.get('url')}")
+                filetype = 'video' # Fallback to video
+            batches.setdefault(filetype, []).append(download_info)
+
         # Add to appropriate master data list and model
-        if filetype == 'video':
-            self.completed_videos_data.append(download_info)
-            if self.current_panel_type == 'completed_videos':
-                self.completed_videos_model.addItem(download_info)
-        elif filetype == 'audio':
-            self.completed_audios_data.append(download_info)
-            if self.current_panel_type == 'completed_audios':
-                self.completed_audios_model.addItem(download_info)
-        elif filetype == 'playlist':
-            self.completed_playlists_data.append(download_info)
-            if self.current_panel_type == 'completed_playlists':
-                self.completed_playlists_model.addItem(download_info)
-        else:
-            print(f"WARNING: Unknown filetype '{filetype}' for completed download: {download_info.get('url')}")
-            self.completed_videos_data.append(download_info) # Fallback to video
-            if self.current_panel_type == 'completed_videos':
-                self.completed_videos_model.addItem(download_info)
+        for filetype, batch in batches.items():
+            data, model, panel_type = targets[filetype]
+            data.extend(batch)
+            if self.current_panel_type == panel_type:
+                model.addItems(batch)
 
         # Remove from active downloads master list and model
-        self.active_downloads_data[:] = [d for d in self.active_downloads_data if d.get('url') != download_info.get('url')]
-        self.active_downloads_model.removeItem(download_info.get('url'))
+        urls = {download_info.get('url') for download_info in completed_infos}
+        self._pop_active_downloads(urls)
+        self.active_downloads_model.removeItems(urls)
         
-        QApplication.processEvents()
+
+    def _pop_active_download(self, url):
+        """Removes a download from the active master list in O(1), keeping the url index in sync.
+
+        The master list's order is never shown (the table sorts its own display list), so the
+        last entry is moved into the freed slot instead of shifting every following row.
+        """
+        row = self._active_index.pop(url, None)
+        if row is None:
+            return None
+        data = self.active_downloads_data
+        item = data[row]
+        last = data.pop()
+        if row < len(data):
+            data[row] = last
+            self._active_index[last['url']] = row
+        return item
+
+    def _pop_active_downloads(self, urls):
+        """Removes several downloads from the active master list, O(1) each via the url index."""
+        for url in urls:
+            self._pop_active_download(url)
 
     # def add_conversion_to_list(self, conversion_info): # Commented out
     #     """Handles the start of a conversion process in the GUI."""
@@ -3581,26 +4237,91 @@ class MainWindow(QMainWindow):
     #     QApplication.processEvents()
 
 
-    def check_flask_message_queue(self):
-        """Periodically checks the Flask message queue for updates to the GUI."""
-        messages_processed = 0
-        max_messages_per_cycle = 10  # Process a limited number of messages per cycle to prevent UI freeze
-        
+    @contextlib.contextmanager
+    def _repaints_suspended(self):
+        """Suspends painting of the content area while a large batch is applied, then repaints once."""
+        self.content_stacked_widget.setUpdatesEnabled(False)
         try:
-            while messages_processed < max_messages_per_cycle:
+            yield
+        finally:
+            self.content_stacked_widget.setUpdatesEnabled(True)
+            self.content_stacked_widget.update()
+
+    def check_flask_message_queue(self):
+        """Drains the Flask message queue; runs whenever the queue's wake-up socket is readable."""
+        if gui_message_queue.qsize() >= self.BULK_REPAINT_THRESHOLD:
+            with self._repaints_suspended():
+                self._drain_flask_message_queue()
+        else:
+            self._drain_flask_message_queue()
+
+    def _drain_flask_message_queue(self):
+        """Processes up to one cycle's worth of queued messages, coalescing updates and completions."""
+        max_messages_per_cycle = 100  # Process a limited number of messages per cycle to prevent UI freeze
+        # Latest status per URL: repeated progress ticks for one download collapse into a single update
+        pending_updates = {}
+        # Finished downloads are moved to their completed lists together at the end of the drain
+        pending_completed = []
+
+        gui_message_queue.clear_wakeups()
+        messages = gui_message_queue.get_batch(max_messages_per_cycle)
+        
+        for message in messages:
+            # Several events posted with one put are handled in order as if queued separately
+            events = message.get('events', ()) if message.get('type') == 'batch' else (message,)
+            for event in events:
                 try:
-                    message = gui_message_queue.get_nowait()
-                    messages_processed += 1
-                    
-                    self._process_queue_message(message) # Process message using helper
-                    
-                except queue.Empty:
-                    break # No more messages in the queue
-                    
+                    self._stage_queue_message(event, pending_updates, pending_completed)
+                except Exception:
+                    # Already dequeued: log this event and keep going with the rest
+                    logger.exception("Error processing queue message of type %r", event.get('type'))
+
+        try:
+            self._flush_pending_updates(pending_updates)
+            self._flush_pending_completions(pending_completed)
         except Exception as e:
             logger.error(f"Error in queue processing: {e}")
             logger.exception("Traceback for queue processing error:")
 
+        # Hit the per-cycle cap: let the event loop breathe, then continue draining
+        if len(messages) >= max_messages_per_cycle:
+            QTimer.singleShot(0, self.check_flask_message_queue)
+
+    def _stage_queue_message(self, message, pending_updates, pending_completed):
+        """Buffers coalescable messages; flushes the buffers and processes anything else immediately."""
+        msg_type = message.get('type')
+        if msg_type == 'update_download_status':
+            # The message dict is ours now: strip the envelope in place and reuse it as the payload
+            del message['type']
+            url = message.pop('url', None)
+            pending = pending_updates.get(url)
+            if pending is None:
+                pending_updates[url] = message
+            else:
+                pending.update(message)
+            return
+
+        # Apply buffered updates first so they stay ordered relative to this message
+        self._flush_pending_updates(pending_updates)
+        if msg_type == 'add_completed':
+            pending_completed.append(message)
+            return
+
+        self._flush_pending_completions(pending_completed)
+        self._process_queue_message(message) # Process message using helper
+
+    def _flush_pending_updates(self, pending_updates):
+        """Applies coalesced status updates collected by check_flask_message_queue."""
+        for url, new_data_dict in pending_updates.items():
+            self.update_download_status_signal.emit(url, new_data_dict)
+        pending_updates.clear()
+
+    def _flush_pending_completions(self, pending_completed):
+        """Moves completions collected by check_flask_message_queue in one batch."""
+        if pending_completed:
+            self.complete_many(pending_completed)
+            pending_completed.clear()
+
     def _process_queue_message(self, message):
         """Processes a single message from the Flask message queue."""
         msg_type = message.get('type')
@@ -3610,48 +4331,55 @@ class MainWindow(QMainWindow):
             cancel_event = message.pop('cancel_event', None)
             self.add_download_signal.emit(message)
             if cancel_event:
-                self._add_process_to_tracker(url, {'process': None, 'cancel_event': cancel_event})
-                logger.debug(f"Added initial download info and cancel_event for URL: {url}")
+                self._add_process_to_tracker(url, None, cancel_event)
+                logger.debug("Added initial download info and cancel_event for URL: %s", url)
 
         elif msg_type == 'register_process':
             process_obj = message['process']
             cancel_event_from_msg = message['cancel_event']
 
-            if url in self.active_processes:
-                self.active_processes[url]['process'] = process_obj
-                if self.active_processes[url].get('cancel_event') is None:
-                    self.active_processes[url]['cancel_event'] = cancel_event_from_msg
-                logger.debug(f"Process object and cancel_event registered for URL: {url}")
+            tracked = self.active_processes.get(url)
+            if tracked is not None:
+                tracked.process = process_obj
+                if tracked.cancel_event is None:
+                    tracked.cancel_event = cancel_event_from_msg
+                logger.debug("Process object and cancel_event registered for URL: %s", url)
             else:
-                self._add_process_to_tracker(url, {'process': process_obj, 'cancel_event': cancel_event_from_msg})
+                self._add_process_to_tracker(url, process_obj, cancel_event_from_msg)
                 logger.warning(f"Process registered for URL {url} without prior add_download message. This might indicate a timing issue.")
 
         elif msg_type == 'update_download_status':
-            self.update_download_status_signal.emit(
-                url, 
-                {k: v for k, v in message.items() if k not in ['type', 'url']}
-            )
+            del message['type']
+            del message['url']
+            self.update_download_status_signal.emit(url, message)
         elif msg_type == 'add_completed':
             self.add_completed_signal.emit(message)
         elif msg_type == 'remove_process': # Handle removal explicitly
             self._remove_process_from_tracker(url)
-            logger.debug(f"Process removed by message for URL: {url}")
+            logger.debug("Process removed by message for URL: %s", url)
         else:
             logger.warning(f"Unknown message type received: {msg_type}")
 
     def browse_extension_directory(self):
         """Opens a file dialog to select the directory for browser extension extraction."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory to Extract Browser Extension")
+        # Start in the folder that holds the current target rather than a cold default
+        start_dir = os.path.dirname(self.extension_path_entry.text().strip())
+        if not os.path.isdir(start_dir):
+            start_dir = os.path.expanduser("~")
+        directory = QFileDialog.getExistingDirectory(self, "Select Directory to Extract Browser Extension", start_dir)
         if directory:
             self.extension_path_entry.setText(os.path.join(directory, "universal_media_tool_extension"))
-            self.show_status_signal.emit(f"Extension will be extracted to: {directory}", "info")
-        QApplication.processEvents()
+            self.show_status_signal.emit(f"Extension will be extracted to: {directory}", "info", 5000)
 
     def browse_global_download_directory(self):
         """Opens a file dialog to set the global default download directory."""
         # Do NOT use 'global global_download_save_directory' here.
         # It's now managed by the settings object.
-        directory = QFileDialog.getExistingDirectory(self, "Select Default Download Directory")
+        # The saved setting already remembers the last choice, so open the dialog there
+        start_dir = settings.get('download_save_directory')
+        if not start_dir or not os.path.isdir(start_dir):
+            start_dir = os.path.expanduser("~")
+        directory = QFileDialog.getExistingDirectory(self, "Select Default Download Directory", start_dir)
         if directory:
             settings.set('download_save_directory', directory) # Use settings.set()
             self.default_download_dir_entry.setText(directory)
@@ -3659,7 +4387,6 @@ class MainWindow(QMainWindow):
             self.show_status_signal.emit(f"Default download directory set to: {directory}", "success", 5000)
         else:
             self.show_status_signal.emit("No directory selected", "info", 5000)
-        QApplication.processEvents()
 
     # def browse_input_file(self): # Commented out
     #     """Opens a file dialog to select an input media file for conversion."""
@@ -3690,100 +4417,79 @@ class MainWindow(QMainWindow):
         """Initiates the extraction of the browser extension files."""
         target_dir = self.extension_path_entry.text().strip()
         if not target_dir:
-            self.show_status_signal.emit("Please select a directory to extract the extension to", "error")
+            self.show_status_signal.emit("Please select a directory to extract the extension to", "error", 5000)
             return
         
-        self.show_status_signal.emit(f"Extracting extension to {target_dir}...", "info")
+        self.show_status_signal.emit(f"Extracting extension to {target_dir}...", "info", 5000)
         self.set_buttons_disabled_signal.emit(True)
-        threading.Thread(target=self._extract_extension_thread, args=(target_dir,)).start()
-        QApplication.processEvents()
+        self.thread_pool.start(FunctionRunnable(self._extract_extension_thread, target_dir))
 
     def _extract_extension_thread(self, target_dir):
         """Threaded function to handle browser extension extraction."""
         try:
-            if not os.path.exists(EXTENSION_SOURCE_DIR_BUNDLE):
+            use_zip = os.path.isfile(EXTENSION_SOURCE_ZIP_BUNDLE)
+            if not use_zip and not os.path.exists(EXTENSION_SOURCE_DIR_BUNDLE):
                 raise FileNotFoundError(f"Extension source folder not found: {EXTENSION_SOURCE_DIR_BUNDLE}. Is it bundled correctly?")
             
             parent_dir = os.path.dirname(target_dir)
             if not os.path.exists(parent_dir):
                 os.makedirs(parent_dir)
 
-            if os.path.exists(target_dir):
-                self.show_status_signal.emit(f"Deleting existing folder: {target_dir}...", "info")
-                try:
-                    shutil.rmtree(target_dir)
-                    self.show_status_signal.emit("Existing folder deleted. Copying new extension...", "info")
-                except OSError as e:
-                    self.show_status_signal.emit(f"Error deleting existing folder: {e}. Please ensure it's not open or locked.", "error")
-                    return
-
-            shutil.copytree(EXTENSION_SOURCE_DIR_BUNDLE, target_dir)
+            # Overwrite in place instead of deleting the folder first; unchanged files are skipped
+            if use_zip:
+                with zipfile.ZipFile(EXTENSION_SOURCE_ZIP_BUNDLE) as archive:
+                    archive.extractall(target_dir)
+            else:
+                _copy_tree_parallel(EXTENSION_SOURCE_DIR_BUNDLE, target_dir)
             
-            self.show_status_signal.emit(f"Extension extracted successfully to: {target_dir}\nNow, go to chrome://extensions/ in your browser, enable 'Developer mode', and click 'Load unpacked' to select this folder.", "success", timeout_ms=15000)
+            self.show_status_signal.emit(f"Extension extracted successfully to: {target_dir}\nNow, go to chrome://extensions/ in your browser, enable 'Developer mode', and click 'Load unpacked' to select this folder.", "success", 15000)
         except PermissionError:
-            self.show_status_signal.emit(f"Permission denied to write to {target_dir}. Please choose a different directory or run as administrator.", "error")
+            self.show_status_signal.emit(f"Permission denied to write to {target_dir}. Please choose a different directory or run as administrator.", "error", 5000)
         except FileNotFoundError as e:
-            self.show_status_signal.emit(f"Error: {e}. Make sure 'extension' folder is in the same directory as app.py before building the executable.", "error")
+            self.show_status_signal.emit(f"Error: {e}. Make sure 'extension' folder is in the same directory as app.py before building the executable.", "error", 5000)
         except Exception as e:
-            self.show_status_signal.emit(f"Failed to extract extension: {e}", "error")
+            self.show_status_signal.emit(f"Failed to extract extension: {e}", "error", 5000)
         finally:
             self.set_buttons_disabled_signal.emit(False)
-        QApplication.processEvents()
 
     def toggle_browser_monitor(self, state):
         """Toggles the browser monitoring feature on/off."""
         new_status = self.browser_monitor_switch.isChecked()
         
-        logger.debug(f"GUI toggle_browser_monitor called. New status: {new_status}")
+        logger.debug("GUI toggle_browser_monitor called. New status: %s", new_status)
+        # The Flask routes read the same SettingsManager, so no request to the server is needed
         settings.set('browser_monitor_enabled', new_status) # Update setting via manager
         
-        self.show_status_signal.emit(f"Browser monitoring {'enabled' if new_status else 'disabled'}", "success")
-        
-        threading.Thread(target=self._send_monitor_status_to_flask, args=(new_status,)).start()
-
-    def _send_monitor_status_to_flask(self, enabled):
-        """Sends the browser monitor status to the Flask server."""
-        try:
-            logger.debug(f"Sending browser monitor status to Flask: {enabled}")
-            response = requests.post(f"http://localhost:{FLASK_PORT}/set_browser_monitor_status", json={"enabled": enabled}, timeout=1) # Short timeout
-            response_data = response.json()
-            logger.debug(f"Flask response to status update: {response_data}")
-        except requests.exceptions.ConnectionError:
-            logger.warning(f"Could not connect to internal Flask server to update monitor status.")
-        except requests.exceptions.Timeout:
-            logger.warning(f"Flask server status update request timed out.")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred while sending monitor status: {e}")
+        self.show_status_signal.emit(f"Browser monitoring {'enabled' if new_status else 'disabled'}", "success", 5000)
 
 
     def open_add_download_dialog(self):
         """Opens a dialog for adding a new download via URL."""
-        self.add_download_dialog = AddDownloadDialog(self)
+        self.add_download_dialog.reset()
         if self.add_download_dialog.exec() == QDialog.Accepted:
             url = self.add_download_dialog.url_entry.text().strip()
             media_type = self.add_download_dialog.media_type_group.checkedButton().text().lower()
             
             if not url:
-                self.show_status_signal.emit("No URL provided for download", "error")
+                self.show_status_signal.emit("No URL provided for download", "error", 5000)
                 return
 
-            self.show_status_signal.emit(f"Initiating download for: {url}...", "info")
+            self.show_status_signal.emit(f"Initiating download for: {url}...", "info", 5000)
             payload = {"url": url, "media_type": media_type, "format_id": "highest"}
-            threading.Thread(target=self.initiate_flask_download, args=(payload,)).start()
-        QApplication.processEvents()
+            self.thread_pool.start(FunctionRunnable(self.initiate_flask_download, payload))
 
     def initiate_flask_download(self, payload):
-        """Sends a download request to the Flask server in a thread."""
+        """Queues a download on a pool thread by calling the download backend in-process."""
         self.set_buttons_disabled_signal.emit(True)
         try:
-            response = requests.post(f"http://localhost:{FLASK_PORT}/download", json=payload, timeout=10)
-            data = response.json()
-            if response.ok:
-                self.show_status_signal.emit(data.get('message', 'Download started.'), 'success')
+            data, status_code = start_download(payload)
+            if 200 <= status_code < 400:
+                self.show_status_signal.emit(data.get('message', 'Download started.'), 'success', 5000)
             else:
-                self.show_status_signal.emit(data.get('error', 'Failed to start download.'), 'error')
-        except requests.exceptions.RequestException as e:
-            self.show_status_signal.emit(f"Connection to server failed: {e}", 'error')
+                self.show_status_signal.emit(data.get('error', 'Failed to start download.'), 'error', 5000)
+        except Exception as e:
+            logger.exception("Failed to start download for %s", payload.get('url'))
+            self.show_status_signal.emit(f"Failed to start download: {e}", 'error', 5000)
         finally:
             self.set_buttons_disabled_signal.emit(False)
 